@@ -0,0 +1,158 @@
+"""
+Asynchronous Queue
+==================
+
+Functions of :mod:`basic.fifo` fail when the queue is full or empty. In a pipeline of
+:mod:`asyncio` coroutines, a producer that outruns its consumer should rather be suspended
+until there is room in the queue, and a consumer should be suspended until there is work.
+Suspending producers of a full queue is called **backpressure**: the slowest stage of the
+pipeline sets the pace for all the stages before it, and memory use stays bounded.
+
+This queue stores elements in the fixed size circular array of :class:`basic.fifo.Queue`
+and adds awaitable operations on top of it. Coroutines are never interrupted between
+awaits, so the array itself needs no lock. Waiting producers and consumers are coordinated
+with **condition variables**, just like in
+:class:`basic.concurrent_heaps.AsyncPriorityQueue`.
+
+Consumers may take elements in **batches**. A batch is returned as soon as at least one
+element is available, so batching does not add latency when the queue runs low.
+
+Backpressure only reaches producers that write to the queue directly. An outside source,
+such as a network socket, can be paused and resumed by **watermark callbacks**: one is
+invoked when the length of the queue rises to the high watermark and the other when it
+falls back to the low watermark. The gap between the two watermarks keeps the source from
+being toggled on every element.
+"""
+import asyncio
+
+from basic.fifo import Queue, enqueue, dequeue
+
+
+class AsyncQueue:
+    """Bounded FIFO queue for :mod:`asyncio` coroutines with watermark callbacks.
+
+    A zero timeout makes an operation non-blocking, it only fails if it cannot proceed
+    right away:
+
+    >>> Q = AsyncQueue(2)
+    >>> async def run():
+    ...     await Q.put(1, timeout=0)
+    ...     await Q.put(2, timeout=0)
+    ...     return await Q.get_many(10, timeout=0), await Q.get_many(10, timeout=0)
+    >>> asyncio.run(run())
+    ([1, 2], [])
+    """
+    Q = None  # Underlying fixed size queue
+    not_empty = None
+    not_full = None
+    high = 0  # High watermark
+    low = 0  # Low watermark
+    on_high = None
+    on_low = None
+    paused = False  # High watermark was reached and low watermark was not yet
+
+    def __init__(self, n, high=None, low=None, on_high=None, on_low=None):
+        """Bounded FIFO queue for asyncio coroutines with watermark callbacks.
+
+        :param int n: Maximum size of the queue.
+        :param int high: (optional) High watermark, the size of the queue by default.
+        :param int low: (optional) Low watermark, half of the high watermark by default.
+        :param ()->None on_high: (optional) Called when the length of the queue rises to the
+         high watermark.
+        :param ()->None on_low: (optional) Called when the length of the queue falls back to
+         the low watermark.
+
+        """
+        self.Q = Queue(n)
+        self.high = n if high is None else high
+        self.low = self.high // 2 if low is None else low
+        if not 0 <= self.low < self.high <= n:
+            raise ValueError("Watermarks out of range")
+        self.on_high = on_high
+        self.on_low = on_low
+        lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(lock)
+        self.not_full = asyncio.Condition(lock)
+
+    def __len__(self):
+        return self.Q.length
+
+    def full(self):
+        """Evaluates if the queue is full.
+        """
+        return self.Q.length == self.Q.size
+
+    def check_watermarks(self):
+        """Invokes a watermark callback if the length of the queue has crossed a watermark.
+        """
+        if not self.paused and self.Q.length >= self.high:
+            self.paused = True
+            if self.on_high is not None:
+                self.on_high()
+        elif self.paused and self.Q.length <= self.low:
+            self.paused = False
+            if self.on_low is not None:
+                self.on_low()
+
+    async def put(self, x, timeout=None):
+        """Adds an element at the tail of the queue, waiting for free space if it is full.
+
+        Complexity:
+            :math:`O(1)`.
+
+        :param object x: An element to insert.
+        :param float timeout: (optional) Maximum time to wait in seconds.
+
+        """
+        async with self.not_full:
+            if self.full():  # Only wait if needed, a timeout may be zero
+                try:
+                    await asyncio.wait_for(self.not_full.wait_for(lambda: not self.full()),
+                                           timeout)
+                except asyncio.TimeoutError:
+                    if self.full():  # Space may have been freed just in time
+                        raise TimeoutError("Queue is full") from None
+            enqueue(self.Q, x)
+            self.check_watermarks()
+            self.not_empty.notify()
+
+    async def get(self, timeout=None):
+        """Removes an element from the head of the queue, waiting if it is empty.
+
+        :param float timeout: (optional) Maximum time to wait in seconds.
+        :return: Removed element.
+
+        """
+        L = await self.get_many(1, timeout)
+        if len(L) == 0:
+            raise TimeoutError("Queue is empty")
+        return L[0]
+
+    async def get_many(self, max_n, timeout=None):
+        """Removes up to :math:`max_n` elements from the head of the queue, waiting until at
+        least one element is available.
+
+        Complexity:
+            :math:`O(max_n)`.
+
+        :param int max_n: Maximum number of elements to remove.
+        :param float timeout: (optional) Maximum time to wait in seconds.
+        :return: List of removed elements in order, empty if the time ran out.
+
+        """
+        L = []
+        async with self.not_empty:
+            if self.Q.length == 0:  # Only wait if needed, a timeout may be zero
+                try:
+                    await asyncio.wait_for(
+                        self.not_empty.wait_for(lambda: self.Q.length > 0), timeout)
+                except asyncio.TimeoutError:
+                    pass  # An element may have arrived just in time, take what is there
+            while len(L) < max_n and self.Q.length > 0:
+                h = self.Q.head
+                L.append(dequeue(self.Q))
+                self.Q.items[h] = None  # Release the reference
+            self.check_watermarks()
+            self.not_full.notify(len(L))
+        return L
+
@@ -0,0 +1,249 @@
+"""
+Block Deque
+===========
+
+Double-ended queue (deque) supports insertion and deletion at both ends. The fixed size
+:class:`basic.fifo.Queue` could be extended to a deque, but it would still have to be
+allocated for the worst case, and a dynamic array that moves its elements on every
+expansion is expensive for a long deque.
+
+This deque stores its elements in fixed size **blocks**. A *map*, an array of pointers to
+blocks, keeps the blocks in order, and the deque occupies a contiguous range of positions
+across them. Position :math:`p` is stored in block :math:`\\lfloor p/b \\rfloor` at offset
+:math:`p \\bmod b`, where :math:`b` is the size of a block. Elements are never moved:
+a push at either end writes into the outermost block, or into a new block if the outermost
+one is full, and a pop releases a block once it becomes empty. Indexed access takes
+:math:`O(1)` time, since the position of an element is a simple offset from the first one.
+
+Only the map is ever reallocated. It has free slots at both ends and is rebuilt, twice as
+large as the number of blocks in use, when one of its ends is reached, which takes
+:math:`O(n/b)` time and happens after at least as many pushes. One released block is kept as
+a *spare*, so that a deque whose end oscillates around a block boundary does not allocate a
+block on every operation.
+
+Blocks may be plain lists or typed :mod:`array` instances for numeric payloads.
+"""
+from array import array
+
+
+class BlockDeque:
+    """Double-ended queue stored in fixed size blocks.
+    """
+    map = []  # Blocks, or None for unused slots
+    b = 0  # Size of a block
+    start = 0  # Position of the first element
+    length = 0
+    typecode = None  # Type of the elements of typed blocks
+    spare = None  # Released block kept for reuse
+
+    def __init__(self, b=64, typecode=None):
+        """Double-ended queue stored in fixed size blocks.
+
+        :param int b: (optional) Number of elements in a block.
+        :param str typecode: (optional) Type code of :class:`array.array` blocks, such as
+         ``"d"`` for doubles. Blocks are lists of objects if omitted.
+
+        """
+        if b < 1:
+            raise ValueError("Block size must be positive")
+        self.map = [None] * 4
+        self.b = b
+        self.start = 2 * b  # Room for two blocks on either side
+        self.typecode = typecode
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield get(self, i)
+
+
+def allocate(D):
+    """Returns an empty block, reusing the spare block if there is one.
+
+    :param BlockDeque D: Instance of a block deque.
+    :return: Block.
+
+    """
+    c = D.spare
+    if c is not None:
+        D.spare = None
+        return c
+    if D.typecode is None:
+        return [None] * D.b
+    return array(D.typecode, bytes(D.b * array(D.typecode).itemsize))
+
+
+def release(D, i):
+    """Removes a block from the map, keeping it as the spare block.
+
+    :param BlockDeque D: Instance of a block deque.
+    :param int i: Index of the block in the map.
+
+    """
+    if D.spare is None:
+        D.spare = D.map[i]
+    D.map[i] = None
+
+
+def remap(D):
+    """Rebuilds the map with the blocks in use centered and free slots on both ends.
+
+    Complexity:
+        :math:`O(n/b)`.
+
+    :param BlockDeque D: Instance of a block deque.
+
+    """
+    first = D.start // D.b
+    last = (D.start + D.length - 1) // D.b if D.length > 0 else first
+    m = last - first + 1  # Number of blocks in use
+    s = max(4, 2 * m + 2)
+    k = (s - m) // 2  # New index of the first block in use
+    M = [None] * s
+    M[k:k + m] = D.map[first:last + 1]
+    D.map = M
+    D.start += (k - first) * D.b
+
+
+def push_back(D, x):
+    """Inserts an element at the back of a deque.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param BlockDeque D: Instance of a block deque.
+    :param object x: An element to insert.
+
+    """
+    p = D.start + D.length
+    if p >= len(D.map) * D.b:
+        remap(D)
+        p = D.start + D.length
+    i, j = divmod(p, D.b)
+    if D.map[i] is None:
+        D.map[i] = allocate(D)
+    D.map[i][j] = x
+    D.length += 1
+
+
+def push_front(D, x):
+    """Inserts an element at the front of a deque.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param BlockDeque D: Instance of a block deque.
+    :param object x: An element to insert.
+
+    """
+    if D.start == 0:
+        remap(D)
+    p = D.start - 1
+    i, j = divmod(p, D.b)
+    if D.map[i] is None:
+        D.map[i] = allocate(D)
+    D.map[i][j] = x
+    D.start = p
+    D.length += 1
+
+
+def pop_back(D):
+    """Removes an element from the back of a deque and returns it.
+
+    Attempt to pop from an empty deque will cause a "deque underflow" error.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param BlockDeque D: Instance of a block deque.
+    :return: Removed element.
+
+    """
+    if D.length == 0:
+        raise ValueError("Deque underflow")
+    i, j = divmod(D.start + D.length - 1, D.b)
+    c = D.map[i]
+    x = c[j]
+    if D.typecode is None:
+        c[j] = None  # Release the reference
+    D.length -= 1
+    if j == 0 or D.length == 0:  # Block is empty
+        release(D, i)
+    return x
+
+
+def pop_front(D):
+    """Removes an element from the front of a deque and returns it.
+
+    Attempt to pop from an empty deque will cause a "deque underflow" error.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param BlockDeque D: Instance of a block deque.
+    :return: Removed element.
+
+    """
+    if D.length == 0:
+        raise ValueError("Deque underflow")
+    i, j = divmod(D.start, D.b)
+    c = D.map[i]
+    x = c[j]
+    if D.typecode is None:
+        c[j] = None  # Release the reference
+    D.start += 1
+    D.length -= 1
+    if j == D.b - 1 or D.length == 0:  # Block is empty
+        release(D, i)
+    return x
+
+
+def get(D, i):
+    """Returns the element at a given index, counting from the front.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param BlockDeque D: Instance of a block deque.
+    :param int i: Index of an element, negative indices count from the back.
+    :return: An element.
+
+    """
+    if i < 0:
+        i += D.length
+    if not 0 <= i < D.length:
+        raise IndexError("Deque index out of range")
+    i, j = divmod(D.start + i, D.b)
+    return D.map[i][j]
+
+
+def extend(D, L):
+    """Inserts a sequence of elements at the back of a deque, in order.
+
+    Elements are copied with a slice assignment per block.
+
+    Complexity:
+        :math:`O(k)` amortized, where :math:`k` is the number of elements.
+
+    :param BlockDeque D: Instance of a block deque.
+    :param list L: Elements to insert.
+
+    """
+    if D.typecode is not None:
+        L = array(D.typecode, L)
+    n = len(L)
+    k = 0
+    while k < n:
+        p = D.start + D.length
+        if p >= len(D.map) * D.b:
+            remap(D)
+            p = D.start + D.length
+        i, j = divmod(p, D.b)
+        if D.map[i] is None:
+            D.map[i] = allocate(D)
+        t = min(D.b - j, n - k)  # Number of elements that fit into the block
+        D.map[i][j:j + t] = L[k:k + t]
+        D.length += t
+        k += t
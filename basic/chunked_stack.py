@@ -0,0 +1,212 @@
+"""
+Chunked Stack
+=============
+
+A fixed size :class:`basic.lifo.Stack` must be allocated for the worst case, which is
+rarely known in advance: the depth of an iterative depth-first search depends on the
+graph. Doubling the array when it is full, like a dynamic table does, removes the limit,
+but every expansion copies all the elements and briefly holds both the old and the new
+array in memory.
+
+This stack is stored in a list of fixed size **chunks** instead. The stack grows by
+appending a new chunk when the last one is full and shrinks by dropping the last chunk
+when it becomes empty. Existing elements are never moved, and all the chunks except the
+last one are full, so no more than a chunk of memory is wasted. One emptied chunk is kept
+as a *spare*, so that a stack whose size oscillates around a chunk boundary does not
+allocate and release a chunk on every operation.
+
+Chunks may be plain lists or typed :mod:`array` instances. A typed chunk of 64-bit
+integers, such as vertex indices, takes 8 bytes per element instead of a pointer to a
+boxed integer.
+
+Bulk operations copy whole slices of a chunk at once.
+"""
+from array import array
+
+
+class ChunkedStack:
+    """Unbounded LIFO structure stored in a list of fixed size chunks.
+    """
+    chunks = []
+    length = 0  # Number of elements in the stack
+    m = 0  # Size of a chunk
+    typecode = None  # Type of the elements of typed chunks
+    spare = None  # Released chunk kept for reuse
+
+    def __init__(self, m=1024, typecode=None):
+        """Unbounded LIFO structure stored in a list of fixed size chunks.
+
+        :param int m: (optional) Number of elements in a chunk.
+        :param str typecode: (optional) Type code of :class:`array.array` chunks, such as
+         ``"q"`` for 64-bit integers. Chunks are lists of objects if omitted.
+
+        """
+        if m < 1:
+            raise ValueError("Chunk size must be positive")
+        self.chunks = []
+        self.m = m
+        self.typecode = typecode
+
+    def __len__(self):
+        return self.length
+
+
+def allocate(S):
+    """Appends an empty chunk to a stack, reusing the spare chunk if there is one.
+
+    Complexity:
+        :math:`O(m)` where :math:`m` is the size of a chunk, :math:`O(1)` if the spare
+        chunk is reused.
+
+    :param ChunkedStack S: Instance of a chunked stack.
+
+    """
+    c = S.spare
+    if c is not None:
+        S.spare = None
+    elif S.typecode is None:
+        c = [None] * S.m
+    else:
+        c = array(S.typecode, bytes(S.m * array(S.typecode).itemsize))
+    S.chunks.append(c)
+
+
+def release(S):
+    """Removes the last chunk of a stack, keeping it as the spare chunk.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param ChunkedStack S: Instance of a chunked stack.
+
+    """
+    c = S.chunks.pop()
+    if S.spare is None:
+        S.spare = c
+
+
+def stack_empty(S):
+    """Evaluates if stack instance is empty.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param ChunkedStack S: Instance of a chunked stack.
+    :return: :data:`True` if stack does not contain any elements, :data:`False` otherwise.
+
+    """
+    return S.length == 0
+
+
+def push(S, x):
+    """Pushes a new element into the stack.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param ChunkedStack S: Instance of a chunked stack.
+    :param object x: An element to insert into stack.
+
+    """
+    i, j = divmod(S.length, S.m)
+    if i == len(S.chunks):
+        allocate(S)
+    S.chunks[i][j] = x
+    S.length += 1
+
+
+def pop(S):
+    """Dereferences an element from the top of the stack and removes it.
+
+    Attempt to pop from an empty stack will cause a "stack underflow" error.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param ChunkedStack S: Instance of a chunked stack.
+    :return: A removed element.
+
+    """
+    if S.length == 0:
+        raise ValueError("Stack underflow")
+    S.length -= 1
+    i, j = divmod(S.length, S.m)
+    c = S.chunks[i]
+    x = c[j]
+    if S.typecode is None:
+        c[j] = None  # Release the reference
+    if j == 0:
+        release(S)
+    return x
+
+
+def peek(S):
+    """Returns current element at the top of the stack without removing it.
+
+    Attempt to peek at an empty stack will cause a "stack underflow" error.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param ChunkedStack S: Instance of a chunked stack.
+    :return: An element at the top of the stack.
+
+    """
+    if S.length == 0:
+        raise ValueError("Empty stack")
+    i, j = divmod(S.length - 1, S.m)
+    return S.chunks[i][j]
+
+
+def push_many(S, L):
+    """Pushes a sequence of elements into the stack, the last one ending up on top.
+
+    Elements are copied with a slice assignment per chunk.
+
+    Complexity:
+        :math:`O(k)` amortized, where :math:`k` is the number of elements.
+
+    :param ChunkedStack S: Instance of a chunked stack.
+    :param list L: Elements to insert.
+
+    """
+    if S.typecode is not None:
+        L = array(S.typecode, L)
+    n = len(L)
+    k = 0
+    while k < n:
+        i, j = divmod(S.length, S.m)
+        if i == len(S.chunks):
+            allocate(S)
+        t = min(S.m - j, n - k)  # Number of elements that fit into the chunk
+        S.chunks[i][j:j + t] = L[k:k + t]
+        S.length += t
+        k += t
+
+
+def pop_many(S, k):
+    """Removes up to :math:`k` elements from the top of the stack.
+
+    Complexity:
+        :math:`O(k)` amortized.
+
+    :param ChunkedStack S: Instance of a chunked stack.
+    :param int k: Maximum number of elements to remove.
+    :return: List of removed elements in the order they would have been popped.
+
+    """
+    L = []
+    while len(L) < k and S.length > 0:
+        i, j = divmod(S.length - 1, S.m)
+        j += 1  # Number of elements in the last chunk
+        t = min(j, k - len(L))
+        c = S.chunks[i]
+        R = c[j - t:j]
+        R.reverse()
+        L.extend(R)
+        if S.typecode is None:
+            c[j - t:j] = [None] * t  # Release the references
+        S.length -= t
+        if t == j:
+            release(S)
+    return L
@@ -0,0 +1,256 @@
+"""
+Concurrent Priority Queues
+==========================
+
+Heap functions of :mod:`basic.heaps` are not safe to call from multiple threads: an
+interrupted sift leaves the array in an inconsistent state. A shared heap has to be
+guarded by a **lock**, so that at most one thread modifies it at a time.
+
+A **blocking queue** also lets consumers wait for elements to appear and, if the queue
+has a capacity limit, lets producers wait for free space. Waiting is implemented with
+**condition variables** bound to the same lock. A waiting thread releases the lock and
+sleeps until another thread signals that the condition might have changed.
+
+Under high contention, acquiring the lock becomes the main cost of a queue operation.
+**Batching** amortizes it: a single acquisition pushes or pops many elements at once.
+
+The same structure is mirrored for :mod:`asyncio` coroutines, where a lock is not needed
+to protect the heap itself, as coroutines are never interrupted between awaits, but
+condition variables still coordinate producers and consumers.
+
+Heap entries are tuples of a priority key, an insertion counter and an element. The
+counter keeps elements with equal keys in FIFO order and ensures that the elements are
+never compared with each other.
+"""
+import asyncio
+import itertools
+import threading
+import time
+
+from basic.heaps import min_heap_insert, min_heap_extract
+
+
+class BlockingPriorityQueue:
+    """Thread-safe min-priority queue with optional capacity.
+    """
+    A = []  # Heap of `(key, counter, element)` entries
+    maxsize = 0  # Capacity, unlimited if not positive
+    lock = None
+    not_empty = None
+    not_full = None
+    counter = None
+
+    def __init__(self, maxsize=0):
+        """Thread-safe min-priority queue with optional capacity.
+
+        :param int maxsize: (optional) Maximum number of elements, unlimited by default.
+
+        """
+        self.A = []
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        self.counter = itertools.count()
+
+    def __len__(self):
+        with self.lock:
+            return len(self.A)
+
+    def has_space(self):
+        """Evaluates if another element fits into the queue.
+        """
+        return self.maxsize <= 0 or len(self.A) < self.maxsize
+
+    def push(self, x, k, timeout=None):
+        """Inserts an element, waiting for free space if the queue is full.
+
+        Complexity:
+            :math:`O(\\log n)`.
+
+        :param object x: An element to insert.
+        :param object k: Priority key, smaller keys come out first.
+        :param float timeout: (optional) Maximum time to wait in seconds.
+
+        """
+        if self.push_many([(x, k)], timeout) == 0:
+            raise TimeoutError("Queue is full")
+
+    def push_many(self, L, timeout=None):
+        """Inserts a batch of elements under a single lock acquisition.
+
+        If the queue fills up, the lock is released until space is available.
+
+        Complexity:
+            :math:`O(m \\log n)` where :math:`m` is the size of the batch.
+
+        :param list L: List of `(element, key)` tuples.
+        :param float timeout: (optional) Maximum time to wait in seconds.
+        :return: Number of inserted elements, less than the size of the batch only if the
+         time ran out.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        i = 0
+        with self.lock:
+            while i < len(L):
+                t = None if deadline is None else max(0.0, deadline - time.monotonic())
+                if not self.not_full.wait_for(self.has_space, t):
+                    break
+                j = i
+                while i < len(L) and self.has_space():
+                    x, k = L[i]
+                    min_heap_insert(self.A, (k, next(self.counter), x))
+                    i += 1
+                self.not_empty.notify(i - j)
+        return i
+
+    def pop(self, timeout=None):
+        """Removes the element with the smallest key, waiting if the queue is empty.
+
+        Complexity:
+            :math:`O(\\log n)`.
+
+        :param float timeout: (optional) Maximum time to wait in seconds.
+        :return: Removed element.
+
+        """
+        L = self.pop_many(1, timeout)
+        if len(L) == 0:
+            raise TimeoutError("Queue is empty")
+        return L[0]
+
+    def pop_many(self, n, timeout=None):
+        """Removes up to :math:`n` elements with the smallest keys under a single lock
+        acquisition, waiting until at least one element is available.
+
+        Complexity:
+            :math:`O(n \\log n)`.
+
+        :param int n: Maximum number of elements to remove.
+        :param float timeout: (optional) Maximum time to wait in seconds.
+        :return: List of removed elements in order of priority, empty if the time ran out.
+
+        """
+        L = []
+        with self.lock:
+            if self.not_empty.wait_for(lambda: len(self.A) > 0, timeout):
+                while len(L) < n and len(self.A) > 0:
+                    L.append(min_heap_extract(self.A)[2])
+                self.not_full.notify(len(L))
+        return L
+
+
+class AsyncPriorityQueue:
+    """Min-priority queue with optional capacity for :mod:`asyncio` coroutines.
+
+    A zero timeout makes an operation non-blocking, it only fails if it cannot proceed
+    right away:
+
+    >>> Q = AsyncPriorityQueue(maxsize=1)
+    >>> async def run():
+    ...     await Q.push("a", 1, timeout=0)
+    ...     full = await Q.push_many([("b", 2)], timeout=0)
+    ...     return full, await Q.pop(timeout=0), await Q.pop_many(1, timeout=0)
+    >>> asyncio.run(run())
+    (0, 'a', [])
+    """
+    A = []  # Heap of `(key, counter, element)` entries
+    maxsize = 0  # Capacity, unlimited if not positive
+    not_empty = None
+    not_full = None
+    counter = None
+
+    def __init__(self, maxsize=0):
+        """Min-priority queue with optional capacity for asyncio coroutines.
+
+        :param int maxsize: (optional) Maximum number of elements, unlimited by default.
+
+        """
+        self.A = []
+        self.maxsize = maxsize
+        lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(lock)
+        self.not_full = asyncio.Condition(lock)
+        self.counter = itertools.count()
+
+    def __len__(self):
+        return len(self.A)
+
+    def has_space(self):
+        """Evaluates if another element fits into the queue.
+        """
+        return self.maxsize <= 0 or len(self.A) < self.maxsize
+
+    async def push(self, x, k, timeout=None):
+        """Inserts an element, waiting for free space if the queue is full.
+
+        :param object x: An element to insert.
+        :param object k: Priority key, smaller keys come out first.
+        :param float timeout: (optional) Maximum time to wait in seconds.
+
+        """
+        if await self.push_many([(x, k)], timeout) == 0:
+            raise TimeoutError("Queue is full")
+
+    async def push_many(self, L, timeout=None):
+        """Inserts a batch of elements, waiting for free space as needed.
+
+        :param list L: List of `(element, key)` tuples.
+        :param float timeout: (optional) Maximum time to wait in seconds.
+        :return: Number of inserted elements, less than the size of the batch only if the
+         time ran out.
+
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        i = 0
+        async with self.not_full:
+            while i < len(L):
+                if not self.has_space():  # Only wait if needed, a timeout may be zero
+                    t = None if deadline is None else max(0.0, deadline - time.monotonic())
+                    try:
+                        await asyncio.wait_for(self.not_full.wait_for(self.has_space), t)
+                    except asyncio.TimeoutError:
+                        if not self.has_space():  # Space may have been freed just in time
+                            break
+                j = i
+                while i < len(L) and self.has_space():
+                    x, k = L[i]
+                    min_heap_insert(self.A, (k, next(self.counter), x))
+                    i += 1
+                self.not_empty.notify(i - j)
+        return i
+
+    async def pop(self, timeout=None):
+        """Removes the element with the smallest key, waiting if the queue is empty.
+
+        :param float timeout: (optional) Maximum time to wait in seconds.
+        :return: Removed element.
+
+        """
+        L = await self.pop_many(1, timeout)
+        if len(L) == 0:
+            raise TimeoutError("Queue is empty")
+        return L[0]
+
+    async def pop_many(self, n, timeout=None):
+        """Removes up to :math:`n` elements with the smallest keys, waiting until at least
+        one element is available.
+
+        :param int n: Maximum number of elements to remove.
+        :param float timeout: (optional) Maximum time to wait in seconds.
+        :return: List of removed elements in order of priority, empty if the time ran out.
+
+        """
+        L = []
+        async with self.not_empty:
+            if len(self.A) == 0:  # Only wait if needed, a timeout may be zero
+                try:
+                    await asyncio.wait_for(self.not_empty.wait_for(lambda: len(self.A) > 0),
+                                           timeout)
+                except asyncio.TimeoutError:
+                    pass  # An element may have arrived just in time, take what is there
+            while len(L) < n and len(self.A) > 0:
+                L.append(min_heap_extract(self.A)[2])
+            self.not_full.notify(len(L))
+        return L
@@ -0,0 +1,192 @@
+"""
+d-ary Heap
+==========
+
+A **d-ary heap** generalizes the binary heap: every node has up to :math:`d` children
+instead of two. Given that the first index of a tree starts at :math:`0`, the children of
+a node at index :math:`i` are stored at indices :math:`di + 1` through :math:`di + d`, and
+the parent of a node is at index :math:`\\lfloor (i - 1) / d \\rfloor`. A binary heap is
+a d-ary heap with :math:`d = 2`.
+
+The height of a d-ary heap is :math:`\\log_d n`, so a wider heap has fewer levels. An
+element that "bubbles up" on insertion or on a key update makes one comparison per level
+and gets cheaper as :math:`d` grows. An element that "sinks" on extraction has to find the
+largest (or the smallest) of :math:`d` children on every level, so it makes :math:`d`
+comparisons per level. The children of a node are stored next to each other, which helps
+memory caches on large heaps. Heaps with :math:`d = 4` or :math:`d = 8` are commonly used
+in practice, especially when insertions and key updates outnumber extractions, as in
+Dijkstra's algorithm.
+
+Functions below mirror the binary heap API of :mod:`basic.heaps` with an additional
+parameter :math:`d`. They are iterative and move a "hole" along the path instead of
+swapping elements on every level.
+"""
+
+
+def d_max_heapify(A, i, d=4, n=None):
+    """Lets the value at :math:`A[i]` "sink" in a d-ary max-heap.
+
+    Complexity:
+        :math:`O(d \\log_d n)`.
+
+    :param list A: Array to heapify.
+    :param int i: Integer index of an element to "sink".
+    :param int d: (optional) Arity of the heap.
+    :param int n: (optional) Size of the heap if only a prefix of the array is a heap.
+
+    """
+    if n is None:
+        n = len(A)
+    x = A[i]
+    while True:
+        l = d * i + 1  # Index of the first child
+        if l >= n:
+            break
+        c = l  # Index of the largest child
+        for j in range(l + 1, min(l + d, n)):
+            if A[j] > A[c]:
+                c = j
+        if not A[c] > x:
+            break
+        A[i] = A[c]  # Child moves up into the hole
+        i = c
+    A[i] = x
+
+
+def build_d_max_heap(A, d=4):
+    """Rearranges an array into a representation of a d-ary max-heap.
+
+    Complexity:
+        :math:`O(n)`.
+
+    :param list A: Array to heapify.
+    :param int d: (optional) Arity of the heap.
+
+    """
+    for i in range((len(A) - 2) // d, -1, -1):  # From the parent of the last element
+        d_max_heapify(A, i, d)
+
+
+def d_max_heap_extract(A, d=4):
+    """Removes max element from the top of a d-ary heap and returns it.
+
+    Complexity:
+        :math:`O(d \\log_d n)`.
+
+    :param list A: Array to heapify.
+    :param int d: (optional) Arity of the heap.
+    :return: The largest element in the array.
+
+    """
+    if len(A) < 1:
+        raise ValueError("Heap underflow")
+    z = A.pop()
+    if len(A) == 0:
+        return z
+    m = A[0]
+    A[0] = z  # Move bottom element to the top
+    d_max_heapify(A, 0, d)
+    return m
+
+
+def d_max_heap_increase_key(A, i, d=4):
+    """Causes element in a d-ary heap to "bubble up" to its appropriate position.
+
+    Complexity:
+        :math:`O(\\log_d n)`.
+
+    :param list A: Array to heapify.
+    :param int i: Integer index of an element to bubble up.
+    :param int d: (optional) Arity of the heap.
+
+    """
+    x = A[i]
+    while i > 0:
+        p = (i - 1) // d  # Parent's index
+        if not x > A[p]:
+            break
+        A[i] = A[p]  # Parent moves down into the hole
+        i = p
+    A[i] = x
+
+
+def d_max_heap_insert(A, z, d=4):
+    """Inserts a new element into a d-ary heap.
+
+    Complexity:
+        :math:`O(\\log_d n)`.
+
+    :param list A: Array to heapify.
+    :param object z: A new element.
+    :param int d: (optional) Arity of the heap.
+
+    """
+    A.append(z)
+    d_max_heap_increase_key(A, len(A) - 1, d)
+
+
+"""
+Mirrored algorithms for min-heap
+"""
+
+
+def d_min_heapify(A, i, d=4, n=None):
+    """Lets the value at :math:`A[i]` "sink" in a d-ary min-heap.
+    """
+    if n is None:
+        n = len(A)
+    x = A[i]
+    while True:
+        l = d * i + 1
+        if l >= n:
+            break
+        c = l
+        for j in range(l + 1, min(l + d, n)):
+            if A[j] < A[c]:
+                c = j
+        if not A[c] < x:
+            break
+        A[i] = A[c]
+        i = c
+    A[i] = x
+
+
+def build_d_min_heap(A, d=4):
+    """Rearranges an array into a representation of a d-ary min-heap.
+    """
+    for i in range((len(A) - 2) // d, -1, -1):
+        d_min_heapify(A, i, d)
+
+
+def d_min_heap_extract(A, d=4):
+    """Removes min element from the top of a d-ary heap and returns it.
+    """
+    if len(A) < 1:
+        raise ValueError("Heap underflow")
+    z = A.pop()
+    if len(A) == 0:
+        return z
+    m = A[0]
+    A[0] = z
+    d_min_heapify(A, 0, d)
+    return m
+
+
+def d_min_heap_increase_key(A, i, d=4):
+    """Causes element in a d-ary min-heap to "bubble up" to its appropriate position.
+    """
+    x = A[i]
+    while i > 0:
+        p = (i - 1) // d
+        if not x < A[p]:
+            break
+        A[i] = A[p]
+        i = p
+    A[i] = x
+
+
+def d_min_heap_insert(A, z, d=4):
+    """Inserts a new element into a d-ary min-heap.
+    """
+    A.append(z)
+    d_min_heap_increase_key(A, len(A) - 1, d)
@@ -0,0 +1,346 @@
+"""
+Disk Queue
+==========
+
+A queue in memory has to hold every element that was enqueued and not yet dequeued. When
+producers outrun consumers for a long time, the backlog may not fit into memory at all.
+A **disk-backed queue** keeps the backlog in files and only a bounded number of elements
+in memory, so a backlog of any length takes constant memory, and it survives a restart of
+the process.
+
+Elements are serialized with :mod:`pickle` and appended, with a header of a 4-byte length
+and a 4-byte CRC-32 **checksum**, to the tail of a sequence of **segment files** of a fixed
+size. When the tail segment is full,
+a new one is started. Appending is a sequential write, the cheapest kind of disk access.
+
+The head segment is **memory-mapped** for reading. Dequeuing reads a batch of records
+straight from the mapping into an in-memory *front buffer*, a :class:`RingBuffer` of
+bounded size, and hands elements out from it. The mapping shares the page cache with the
+writer, so freshly written records are visible to the reader as soon as they are flushed.
+
+The position of the head, a segment number and an offset, is saved to a small metadata
+file on every *commit*. A commit first forces the records of the tail segment to the disk,
+and a full segment is forced to the disk before it is closed. The position is then written
+to a temporary name, forced to the disk and renamed over the old one, and the directory is
+synced as well. A crash therefore leaves either the old or the new position, and in both
+cases the records before it. Records enqueued after the last commit may be lost. If the
+tail segment turns out shorter than the saved position, the head is moved back to its end.
+A metadata file of the wrong size is ignored, and the queue resumes from the oldest
+segment.
+
+After a restart, the queue resumes right after the last committed element, so elements
+dequeued after the last commit are delivered again. Segments behind the committed head are
+spent. Rather than being deleted, a spent segment is kept as a *spare* and renamed into the
+next tail segment, which saves creating a new file.
+
+Segments are preallocated with zeros, so a zero length marks the end of the records in a
+segment. A record that was only partially written before a crash either runs past the end
+of the segment or fails its checksum, and it ends the records of the segment as well. When
+the queue is reopened, the tail segment is cut at its last valid record and refilled with
+zeros, so new records do not mix with the remains of a torn one. A record that does not fit
+into an empty segment gets an oversized segment of its own.
+"""
+import mmap
+import os
+import pickle
+import struct
+import zlib
+
+from basic.ring_buffer import RingBuffer, enqueue, dequeue
+
+HEADER = struct.Struct("<II")  # Length and checksum of a record
+POSITION = struct.Struct("<qq")  # Segment number and offset of the head
+
+
+def read_record(data, i):
+    """Reads the serialized element of a record, verifying its checksum.
+
+    Complexity:
+        :math:`O(m)` where :math:`m` is the size of the record.
+
+    :param data: Contents of a segment, :data:`bytes` or a memory map.
+    :param int i: Offset of the record.
+    :return: Serialized element or :data:`None` if there is no valid record at the offset.
+
+    """
+    if i + HEADER.size > len(data):
+        return None
+    n, c = HEADER.unpack_from(data, i)
+    j = i + HEADER.size + n
+    if n == 0 or j > len(data):  # End of records or a torn write
+        return None
+    b = data[i + HEADER.size:j]
+    if zlib.crc32(b) != c:  # Torn or corrupted record
+        return None
+    return b
+
+
+def sync_directory(path):
+    """Forces the entries of a directory, such as a renamed file, to the storage device.
+
+    Does nothing on platforms that cannot open a directory.
+
+    :param str path: Directory.
+
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    d = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(d)
+    finally:
+        os.close(d)
+
+
+class DiskQueue:
+    """Persistent FIFO queue stored in segment files, with a bounded front buffer.
+    """
+    path = ""  # Directory of the queue
+    segment_size = 0
+    buffer_size = 0
+    front = None  # Buffer of `(element, segment, offset)` tuples read ahead from disk
+    head = (0, 0)  # Position after the last dequeued element
+    first = 0  # Number of the oldest segment on disk
+    read_seg = 0  # Position of the next record to read into the buffer
+    read_off = 0
+    tail = 0  # Number of the tail segment
+    tail_off = 0  # Offset of the next record in the tail segment
+    writer = None  # File object of the tail segment
+    mm = None  # Memory map of the segment being read
+    mm_seg = -1
+
+    def __init__(self, path, segment_size=64 << 20, buffer_size=1024):
+        """Persistent FIFO queue stored in segment files, with a bounded front buffer.
+
+        Opens an existing queue in the directory, or creates a new one.
+
+        :param str path: Directory of the queue.
+        :param int segment_size: (optional) Size of a segment file in bytes.
+        :param int buffer_size: (optional) Maximum number of elements read ahead into
+         memory.
+
+        """
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.segment_size = segment_size
+        self.buffer_size = buffer_size
+        self.front = RingBuffer(buffer_size)
+        S = sorted(int(f[:-4]) for f in os.listdir(path) if f.endswith(".seg"))
+        try:
+            with open(os.path.join(path, "head"), "rb") as f:
+                self.head = POSITION.unpack(f.read())
+        except (FileNotFoundError, struct.error):  # Missing or incomplete
+            self.head = (S[0] if S else 0, 0)
+        for s in S:
+            if s < self.head[0]:  # Spent segments left over from the last run
+                os.remove(self.segment(s))
+        S = [s for s in S if s >= self.head[0]]
+        self.first = self.head[0]
+        self.read_seg, self.read_off = self.head
+        if len(S) == 0:
+            self.tail = self.head[0]
+            self.writer = self.create(self.tail)
+        else:
+            self.tail = S[-1]
+            self.writer = open(self.segment(self.tail), "r+b")
+            self.tail_off = self.scan(self.tail)
+            self.writer.truncate(self.tail_off)  # Zero out the remains of a torn record
+            self.writer.truncate(max(self.tail_off, self.segment_size))
+            self.writer.seek(self.tail_off)
+            if self.head[0] == self.tail and self.head[1] > self.tail_off:
+                self.head = (self.tail, self.tail_off)  # Records behind the head were lost
+                self.read_seg, self.read_off = self.head
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def segment(self, s):
+        """Returns the path of a segment file.
+        """
+        return os.path.join(self.path, "%016d.seg" % s)
+
+    def create(self, s):
+        """Creates a zero-filled segment file, reusing the spare segment if there is one.
+
+        :param int s: Segment number.
+        :return: File object open for writing at the start of the segment.
+
+        """
+        spare = os.path.join(self.path, "spare")
+        if os.path.exists(spare):
+            os.replace(spare, self.segment(s))
+            f = open(self.segment(s), "r+b")
+            f.truncate(0)  # Discard old records, the file is then extended with zeros
+        else:
+            f = open(self.segment(s), "w+b")
+        f.truncate(self.segment_size)
+        return f
+
+    def scan(self, s):
+        """Finds the end of the records in a segment.
+
+        Complexity:
+            :math:`O(m)` where :math:`m` is the number of records in the segment.
+
+        :param int s: Segment number.
+        :return: Offset after the last complete record.
+
+        """
+        with open(self.segment(s), "rb") as f:
+            data = f.read()
+        i = 0
+        b = read_record(data, i)
+        while b is not None:
+            i += HEADER.size + len(b)
+            b = read_record(data, i)
+        return i
+
+    def enqueue(self, x):
+        """Appends an element at the tail of the queue.
+
+        Complexity:
+            :math:`O(1)`, plus the size of the serialized element.
+
+        :param object x: An element to insert.
+
+        """
+        b = pickle.dumps(x, pickle.HIGHEST_PROTOCOL)
+        r = HEADER.size + len(b)
+        if self.tail_off > 0 and self.tail_off + r > self.segment_size:
+            self.flush(sync=True)  # Records of a closed segment are not synced by a commit
+            self.writer.close()
+            self.tail += 1
+            self.writer = self.create(self.tail)
+            self.tail_off = 0
+        self.writer.write(HEADER.pack(len(b), zlib.crc32(b)) + b)
+        self.tail_off += r
+
+    def map(self, s):
+        """Memory-maps a segment for reading.
+
+        :param int s: Segment number.
+
+        """
+        if self.mm is not None:
+            self.mm.close()
+        with open(self.segment(s), "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.mm_seg = s
+
+    def refill(self):
+        """Reads records from disk into the front buffer until it is full or no records are
+        left.
+
+        Complexity:
+            :math:`O(m)` where :math:`m` is the size of the buffer.
+
+        """
+        self.writer.flush()  # Make the latest records visible to the mapping
+        while self.front.length < self.buffer_size:
+            if self.mm_seg != self.read_seg:
+                self.map(self.read_seg)
+            i = self.read_off
+            if i + HEADER.size <= len(self.mm) and \
+                    i + HEADER.size + HEADER.unpack_from(self.mm, i)[0] > len(self.mm):
+                self.map(self.read_seg)  # Segment grew after mapping
+            b = read_record(self.mm, i)
+            if b is None:
+                if self.read_seg == self.tail:
+                    break
+                self.read_seg += 1  # Segment is exhausted
+                self.read_off = 0
+                continue
+            self.read_off = i + HEADER.size + len(b)
+            enqueue(self.front, (pickle.loads(b), self.read_seg, self.read_off))
+
+    def dequeue(self):
+        """Removes an element from the head of the queue and returns it.
+
+        Attempt to dequeue from an empty queue will cause a "queue underflow" error.
+
+        Complexity:
+            :math:`O(1)` amortized.
+
+        :return: Removed element.
+
+        """
+        if self.front.length == 0:
+            self.refill()
+        if self.front.length == 0:
+            raise ValueError("Queue underflow")
+        x, s, i = dequeue(self.front)
+        self.head = (s, i)
+        return x
+
+    def next(self):
+        """Returns current element at the head of the queue without removing it.
+
+        :return: An element at the head of the queue.
+
+        """
+        if self.front.length == 0:
+            self.refill()
+        if self.front.length == 0:
+            raise ValueError("Empty queue")
+        return self.front.items[self.front.head][0]
+
+    def empty(self):
+        """Evaluates if the queue is empty.
+
+        :return: :data:`True` if queue does not contain any elements.
+
+        """
+        if self.front.length == 0:
+            self.refill()
+        return self.front.length == 0
+
+    def flush(self, sync=False):
+        """Writes buffered records to the tail segment.
+
+        :param bool sync: (optional) Also force the records to the storage device.
+
+        """
+        self.writer.flush()
+        if sync:
+            os.fsync(self.writer.fileno())
+
+    def commit(self):
+        """Saves the position of the head, so that a reopened queue resumes after the last
+        dequeued element, and recycles spent segments.
+
+        Complexity:
+            :math:`O(k)` where :math:`k` is the number of spent segments.
+
+        """
+        self.flush(sync=True)  # Records must be durable before their position
+        tmp = os.path.join(self.path, "head.tmp")
+        with open(tmp, "wb") as f:
+            f.write(POSITION.pack(*self.head))
+            f.flush()
+            os.fsync(f.fileno())  # Contents must reach the disk before the rename
+        os.replace(tmp, os.path.join(self.path, "head"))  # Atomic update
+        sync_directory(self.path)
+        spare = os.path.join(self.path, "spare")
+        while self.first < self.head[0]:
+            if self.mm_seg == self.first:
+                self.mm.close()
+                self.mm = None
+                self.mm_seg = -1
+            if os.path.exists(spare):
+                os.remove(self.segment(self.first))
+            else:
+                os.replace(self.segment(self.first), spare)
+            self.first += 1
+
+    def close(self):
+        """Commits the position of the head and closes the files of the queue.
+        """
+        self.commit()
+        self.writer.close()
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+            self.mm_seg = -1
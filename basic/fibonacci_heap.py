@@ -0,0 +1,338 @@
+"""
+Fibonacci Heap
+==============
+
+Fibonacci heap is a **mergeable heap** made of a collection of heap-ordered trees. Roots
+of the trees are kept in a circular doubly linked *root list*, and the heap holds a pointer
+to the root with the minimum key. Children of every node also form a circular doubly linked
+list, so that nodes can be spliced in and out in :math:`O(1)` time.
+
+Fibonacci heap is "lazy". Insertion and union simply concatenate root lists. All the work
+of combining the trees is deferred until extract-min, which **consolidates** the root list
+by linking roots of equal degree until every root has a distinct degree. Decrease-key cuts
+a node whose key became smaller than its parent's and moves it to the root list. A node
+that loses a second child is cut as well (**cascading cut**), which keeps the size of a
+subtree exponential in its degree. The name of the heap comes from this bound: a subtree
+rooted at a node of degree :math:`k` has at least :math:`F_{k+2}` nodes, where
+:math:`F_k` is the :math:`k`-th Fibonacci number.
+
+Amortized costs are :math:`O(1)` for insert, union and decrease-key, and
+:math:`O(\\log n)` for extract-min and delete. With a Fibonacci heap Dijkstra's algorithm
+runs in :math:`O(V \\log V + E)` time. Constant factors are high, so in practice Fibonacci
+heaps pay off only on large graphs with many decrease-key operations.
+"""
+
+
+class Node:
+    """Node of a Fibonacci heap.
+
+    Holds a key, an optional satellite item, pointers to the parent, to any one of its
+    children and to its left and right siblings, the number of children (degree) and a
+    mark that denotes whether the node has lost a child since it became a child itself.
+    """
+    key = None
+    item = None
+    p = None
+    child = None
+    left = None
+    right = None
+    degree = 0
+    mark = False
+
+    def __init__(self, key, item=None):
+        """Node of a Fibonacci heap.
+
+        :param object key: Node's key.
+        :param object item: (optional) Satellite data.
+
+        """
+        self.key = key
+        self.item = item
+        self.left = self
+        self.right = self
+
+    def __str__(self):
+        return str(self.key)
+
+
+class FibonacciHeap:
+    """Fibonacci heap, holds a pointer to the minimum root and the number of nodes.
+    """
+    min = None
+    n = 0
+
+    def __len__(self):
+        return self.n
+
+
+def splice(x, y):
+    """Concatenates two circular doubly linked lists.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param basic.fibonacci_heap.Node x: Node of a list.
+    :param basic.fibonacci_heap.Node y: Node of another list.
+
+    """
+    x_right = x.right
+    y_left = y.left
+    x.right = y
+    y.left = x
+    y_left.right = x_right
+    x_right.left = y_left
+
+
+def remove(x):
+    """Removes a node from its circular doubly linked list.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param basic.fibonacci_heap.Node x: Node to remove.
+
+    """
+    x.left.right = x.right
+    x.right.left = x.left
+    x.left = x
+    x.right = x
+
+
+def fib_heap_insert(H, x):
+    """Inserts a new node into a Fibonacci heap.
+
+    The node becomes a new single-node tree in the root list.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param FibonacciHeap H: Fibonacci heap.
+    :param basic.fibonacci_heap.Node x: New node.
+    :return: Inserted node, which serves as its handle.
+
+    """
+    x.degree = 0
+    x.p = None
+    x.child = None
+    x.mark = False
+    x.left = x
+    x.right = x
+    if H.min is None:
+        H.min = x
+    else:
+        splice(H.min, x)
+        if x.key < H.min.key:
+            H.min = x
+    H.n += 1
+    return x
+
+
+def fib_heap_minimum(H):
+    """Returns the node with the minimum key.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param FibonacciHeap H: Fibonacci heap.
+    :return: Node with the minimum key.
+
+    """
+    if H.min is None:
+        raise ValueError("Empty heap")
+    return H.min
+
+
+def fib_heap_union(H1, H2):
+    """Unites two Fibonacci heaps into a new one.
+
+    Both input heaps are destroyed in the process.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param FibonacciHeap H1: Fibonacci heap.
+    :param FibonacciHeap H2: Another Fibonacci heap.
+    :return: Resulting :data:`FibonacciHeap`.
+
+    """
+    H = FibonacciHeap()
+    H.min = H1.min
+    if H1.min is None:
+        H.min = H2.min
+    elif H2.min is not None:
+        splice(H1.min, H2.min)
+        if H2.min.key < H1.min.key:
+            H.min = H2.min
+    H.n = H1.n + H2.n
+    return H
+
+
+def fib_heap_extract_min(H):
+    """Removes the node with the minimum key from a Fibonacci heap.
+
+    Children of the minimum node are moved to the root list, then the root list is
+    consolidated.
+
+    Complexity:
+        :math:`O(\\log n)` amortized.
+
+    :param FibonacciHeap H: Fibonacci heap.
+    :return: Removed node.
+
+    """
+    z = H.min
+    if z is None:
+        raise ValueError("Heap underflow")
+    x = z.child
+    if x is not None:  # Move children to the root list
+        while True:
+            x.p = None
+            x = x.right
+            if x is z.child:
+                break
+        splice(z, x)
+        z.child = None
+    if z.right is z:
+        H.min = None
+    else:
+        H.min = z.right
+        remove(z)
+        consolidate(H)
+    H.n -= 1
+    return z
+
+
+def consolidate(H):
+    """Links roots of equal degree until every root in the root list has a distinct degree.
+
+    Complexity:
+        :math:`O(\\log n)` amortized, :math:`O(D(n) + t)` actual, where :math:`D(n)` is the
+        maximum degree and :math:`t` is the number of roots.
+
+    :param FibonacciHeap H: Fibonacci heap.
+
+    """
+    A = {}  # Roots by degree
+    roots = []
+    w = H.min
+    while True:
+        roots.append(w)
+        w = w.right
+        if w is H.min:
+            break
+    for x in roots:
+        d = x.degree
+        while d in A:
+            y = A.pop(d)  # Another root with the same degree
+            if y.key < x.key:
+                x, y = y, x
+            fib_heap_link(H, y, x)
+            d += 1
+        A[d] = x
+    H.min = None
+    for x in A.values():  # Root list now consists of the roots in `A`
+        if H.min is None or x.key < H.min.key:
+            H.min = x
+
+
+def fib_heap_link(H, y, x):
+    """Makes root :math:`y` a child of root :math:`x`.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param FibonacciHeap H: Fibonacci heap.
+    :param basic.fibonacci_heap.Node y: Root to become a child.
+    :param basic.fibonacci_heap.Node x: Root to become a parent.
+
+    """
+    remove(y)
+    if x.child is None:
+        x.child = y
+    else:
+        splice(x.child, y)
+    y.p = x
+    x.degree += 1
+    y.mark = False
+
+
+def fib_heap_decrease_key(H, x, k):
+    """Decreases the key of a node.
+
+    If heap order is violated, the node is cut from its parent and becomes a root.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param FibonacciHeap H: Fibonacci heap.
+    :param basic.fibonacci_heap.Node x: Node to update.
+    :param object k: New key, not greater than the current one.
+
+    """
+    if x.key < k:
+        raise ValueError("New key is greater than current key")
+    x.key = k
+    y = x.p
+    if y is not None and x.key < y.key:
+        cut(H, x, y)
+        cascading_cut(H, y)
+    if x.key < H.min.key:
+        H.min = x
+
+
+def cut(H, x, y):
+    """Cuts node :math:`x` from its parent :math:`y` and moves it to the root list.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param FibonacciHeap H: Fibonacci heap.
+    :param basic.fibonacci_heap.Node x: Node to cut.
+    :param basic.fibonacci_heap.Node y: Parent of the node.
+
+    """
+    if y.child is x:
+        y.child = None if x.right is x else x.right
+    remove(x)
+    y.degree -= 1
+    splice(H.min, x)
+    x.p = None
+    x.mark = False
+
+
+def cascading_cut(H, y):
+    """Cuts marked ancestors of a node that lost a child.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param FibonacciHeap H: Fibonacci heap.
+    :param basic.fibonacci_heap.Node y: Node that lost a child.
+
+    """
+    z = y.p
+    while z is not None:
+        if not y.mark:
+            y.mark = True
+            break
+        cut(H, y, z)
+        y = z
+        z = y.p
+
+
+def fib_heap_delete(H, x):
+    """Removes an arbitrary node from a Fibonacci heap.
+
+    Complexity:
+        :math:`O(\\log n)` amortized.
+
+    :param FibonacciHeap H: Fibonacci heap.
+    :param basic.fibonacci_heap.Node x: Node to remove.
+
+    """
+    y = x.p
+    if y is not None:
+        cut(H, x, y)
+        cascading_cut(H, y)
+    H.min = x  # Forcing the node to the top is equivalent to decreasing its key to -inf
+    fib_heap_extract_min(H)
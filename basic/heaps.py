@@ -22,7 +22,7 @@ various algorithms where a fast prioritization of elements is required.
 """
 
 
-def max_heapify(A, i):
+def max_heapify(A, i, n=None):
     """Rearranges elements in array to maintain max-heap properties.
 
     The algorithm implicitly assumes that binary trees rooted at indexes :math:`l` and
@@ -38,9 +38,11 @@ def max_heapify(A, i):
 
     :param list A: Array to heapify.
     :param int i: Integer index of an element to "sink".
+    :param int n: (optional) Size of the heap if only a prefix of the array is a heap.
 
     """
-    n = len(A)
+    if n is None:
+        n = len(A)
     l = 2 * i + 1  # Index of a left child
     r = 2 * i + 2  # Index of a right child
     i_largest = i  # Index of a largest element (`i` by default)
@@ -205,3 +207,225 @@ def min_heap_insert(A, z):
     i_n = n - 1
     if n > 1:
         min_heap_increase_key(A, i_n)
+
+
+"""
+Indexed priority queue
+"""
+
+
+class Handle:
+    """Reference to an element stored in a :data:`PriorityQueue`.
+
+    Handle keeps the element, its priority key and its current position in the heap array.
+    The position is updated every time the element moves, so the element can be located
+    in :math:`O(1)` time.
+    """
+    key = None
+    item = None
+    i = -1  # Index in the heap array, -1 once the element is removed
+
+    def __init__(self, item, key):
+        """Reference to an element stored in a priority queue.
+
+        :param object item: Stored element.
+        :param object key: Priority key.
+
+        """
+        self.item = item
+        self.key = key
+
+
+class PriorityQueue:
+    """Indexed min-priority queue.
+
+    Functions above locate an element only by its index in the array, which the caller
+    rarely knows after a few operations have shuffled the heap. This queue stores
+    :data:`Handle` objects in a binary min-heap instead of bare elements. Every handle
+    records its own index, serving as an item-to-index map that also works for
+    unhashable elements. Handles returned by :meth:`push()` can then be used to change the
+    priority of an element or to remove it.
+
+    Sift operations are iterative. An element is lifted out of the array and a "hole" is
+    moved along the path instead of swapping on every level, which halves the number of
+    writes.
+    """
+    A = []  # Heap array of handles
+
+    def __init__(self):
+        """Indexed min-priority queue.
+        """
+        self.A = []
+
+    def __len__(self):
+        return len(self.A)
+
+    def push(self, x, k):
+        """Inserts a new element.
+
+        Complexity:
+            :math:`O(\log n)`.
+
+        :param object x: An element to insert.
+        :param object k: Priority key, smaller keys come out first.
+        :return: :data:`Handle` of the element.
+
+        """
+        h = Handle(x, k)
+        self.A.append(h)
+        self.sift_up(len(self.A) - 1, h)
+        return h
+
+    def peek(self):
+        """Returns the element with the smallest key without removing it.
+
+        Complexity:
+            :math:`O(1)`.
+
+        :return: An element at the top of the heap.
+
+        """
+        if len(self.A) == 0:
+            raise ValueError("Empty heap")
+        return self.A[0].item
+
+    def pop(self):
+        """Removes the element with the smallest key and returns it.
+
+        Complexity:
+            :math:`O(\log n)`.
+
+        :return: Removed element.
+
+        """
+        if len(self.A) == 0:
+            raise ValueError("Heap underflow")
+        return self.remove(self.A[0])
+
+    def remove(self, h):
+        """Removes an element by its handle.
+
+        Complexity:
+            :math:`O(\log n)`.
+
+        :param Handle h: Handle of an element to remove.
+        :return: Removed element.
+
+        """
+        A = self.A
+        i = self.index(h)
+        z = A.pop()  # Bottom element fills the vacated slot
+        if z is not h:
+            if i > 0 and z.key < A[(i - 1) // 2].key:
+                self.sift_up(i, z)
+            else:
+                self.sift_down(i, z)
+        h.i = -1
+        return h.item
+
+    def index(self, h):
+        """Returns the position of an element in the heap array.
+
+        Handles of elements that were popped or removed are rejected:
+
+        >>> Q = PriorityQueue()
+        >>> a, b, c = Q.push("a", 1), Q.push("b", 2), Q.push("c", 3)
+        >>> Q.pop()
+        'a'
+        >>> Q.decrease_key(a, 0)
+        Traceback (most recent call last):
+        ...
+        ValueError: Element is not in the queue
+        >>> [Q.pop() for _ in range(len(Q))]
+        ['b', 'c']
+
+        Complexity:
+            :math:`O(1)`.
+
+        :param Handle h: Handle of an element.
+        :return: Index of the handle in the heap array.
+
+        """
+        i = h.i
+        if i < 0 or i >= len(self.A) or self.A[i] is not h:
+            raise ValueError("Element is not in the queue")
+        return i
+
+    def decrease_key(self, h, k):
+        """Lowers the priority key of an element, moving it towards the top.
+
+        Complexity:
+            :math:`O(\log n)`.
+
+        :param Handle h: Handle of an element.
+        :param object k: New key, not greater than the current one.
+
+        """
+        i = self.index(h)
+        if h.key < k:
+            raise ValueError("New key is greater than current key")
+        h.key = k
+        self.sift_up(i, h)
+
+    def increase_key(self, h, k):
+        """Raises the priority key of an element, moving it towards the bottom.
+
+        Complexity:
+            :math:`O(\log n)`.
+
+        :param Handle h: Handle of an element.
+        :param object k: New key, not less than the current one.
+
+        """
+        i = self.index(h)
+        if k < h.key:
+            raise ValueError("New key is smaller than current key")
+        h.key = k
+        self.sift_down(i, h)
+
+    def sift_up(self, i, h):
+        """Places a handle into the hole at index :math:`i` and lets it "bubble up".
+
+        Complexity:
+            :math:`O(\log n)`.
+
+        :param int i: Index of the hole.
+        :param Handle h: Handle to place.
+
+        """
+        A = self.A
+        while i > 0:
+            p = (i - 1) // 2
+            if not h.key < A[p].key:
+                break
+            A[i] = A[p]  # Parent moves down into the hole
+            A[i].i = i
+            i = p
+        A[i] = h
+        h.i = i
+
+    def sift_down(self, i, h):
+        """Places a handle into the hole at index :math:`i` and lets it "sink".
+
+        Complexity:
+            :math:`O(\log n)`.
+
+        :param int i: Index of the hole.
+        :param Handle h: Handle to place.
+
+        """
+        A = self.A
+        n = len(A)
+        while True:
+            l = 2 * i + 1
+            if l >= n:
+                break
+            r = l + 1
+            c = r if r < n and A[r].key < A[l].key else l  # Smaller child
+            if not A[c].key < h.key:
+                break
+            A[i] = A[c]  # Child moves up into the hole
+            A[i].i = i
+            i = c
+        A[i] = h
+        h.i = i
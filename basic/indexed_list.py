@@ -0,0 +1,190 @@
+"""
+Indexed Linked List
+===================
+
+Searching a :class:`basic.linked_list.LinkedList` takes linear time, since the list has to
+be scanned from the head. An **indexed** linked list keeps a hash table next to the list,
+mapping every key to the nodes that hold it. The table is updated on every insertion and
+deletion, so a node with a given key is found in :math:`O(1)` expected time, while the
+list itself still defines the order of the elements.
+
+Several nodes may hold the same key. The table maps a key to an insertion-ordered set of
+its nodes (a :class:`dict` with no values), so a particular node is removed from the table
+in constant time as well.
+
+The list also keeps a pointer to its **tail**. With both ends at hand, elements can be
+appended as well as prepended, and any node can be moved to the front or to the back of
+the list in constant time. These are the basic operations of recency-ordered structures,
+such as caches and self-organizing lists.
+
+Keys must be hashable.
+"""
+from basic.linked_list import LinkedList
+
+
+class IndexedLinkedList(LinkedList):
+    """Doubly linked list with a hash table of its keys and a pointer to its tail.
+    """
+    tail = None
+    index = {}  # Key to an ordered set of nodes
+    length = 0
+
+    def __init__(self):
+        """Doubly linked list with a hash table of its keys and a pointer to its tail.
+        """
+        self.index = {}
+
+    def __len__(self):
+        return self.length
+
+
+def list_search(L, k):
+    """Finds the most recently inserted node with a given key.
+
+    Complexity:
+        :math:`O(1)` expected.
+
+    :param IndexedLinkedList L: An instance of an indexed linked list.
+    :param object k: A key to search.
+    :return: A :data:`Node` or :data:`None` if key was not found.
+
+    """
+    N = L.index.get(k)
+    if N is None:
+        return None
+    return next(reversed(N))
+
+
+def list_search_all(L, k):
+    """Finds all nodes with a given key in the order of their insertion.
+
+    Complexity:
+        :math:`O(m)` where :math:`m` is the number of nodes with the key.
+
+    :param IndexedLinkedList L: An instance of an indexed linked list.
+    :param object k: A key to search.
+    :return: List of nodes, empty if key was not found.
+
+    """
+    return list(L.index.get(k, ()))
+
+
+def link(L, x, front):
+    """Attaches a detached node at the head or the tail of a list.
+
+    :param IndexedLinkedList L: An instance of an indexed linked list.
+    :param basic.linked_list.Node x: Node to attach.
+    :param bool front: Attach at the head if :data:`True`, at the tail otherwise.
+
+    """
+    if front:
+        x.prev = None
+        x.next = L.head
+        if L.head is not None:
+            L.head.prev = x
+        else:
+            L.tail = x
+        L.head = x
+    else:
+        x.next = None
+        x.prev = L.tail
+        if L.tail is not None:
+            L.tail.next = x
+        else:
+            L.head = x
+        L.tail = x
+
+
+def unlink(L, x):
+    """Detaches a node from a list, keeping it in the index.
+
+    :param IndexedLinkedList L: An instance of an indexed linked list.
+    :param basic.linked_list.Node x: Node to detach.
+
+    """
+    if x.prev is not None:
+        x.prev.next = x.next
+    else:
+        L.head = x.next
+    if x.next is not None:
+        x.next.prev = x.prev
+    else:
+        L.tail = x.prev
+
+
+def list_insert(L, x):
+    """Inserts a new node at the head of an indexed linked list.
+
+    Complexity:
+        :math:`O(1)` expected.
+
+    :param IndexedLinkedList L: An instance of an indexed linked list.
+    :param basic.linked_list.Node x: A new node to insert.
+
+    """
+    link(L, x, True)
+    L.index.setdefault(x.key, {})[x] = None
+    L.length += 1
+
+
+def list_append(L, x):
+    """Inserts a new node at the tail of an indexed linked list.
+
+    Complexity:
+        :math:`O(1)` expected.
+
+    :param IndexedLinkedList L: An instance of an indexed linked list.
+    :param basic.linked_list.Node x: A new node to insert.
+
+    """
+    link(L, x, False)
+    L.index.setdefault(x.key, {})[x] = None
+    L.length += 1
+
+
+def list_delete(L, x):
+    """Removes a node from an indexed linked list.
+
+    Complexity:
+        :math:`O(1)` expected.
+
+    :param IndexedLinkedList L: An instance of an indexed linked list.
+    :param basic.linked_list.Node x: Node to remove.
+
+    """
+    unlink(L, x)
+    N = L.index[x.key]
+    del N[x]
+    if len(N) == 0:
+        del L.index[x.key]
+    L.length -= 1
+
+
+def move_to_front(L, x):
+    """Moves a node of an indexed linked list to its head.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param IndexedLinkedList L: An instance of an indexed linked list.
+    :param basic.linked_list.Node x: Node to move.
+
+    """
+    if L.head is not x:
+        unlink(L, x)
+        link(L, x, True)
+
+
+def move_to_back(L, x):
+    """Moves a node of an indexed linked list to its tail.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param IndexedLinkedList L: An instance of an indexed linked list.
+    :param basic.linked_list.Node x: Node to move.
+
+    """
+    if L.tail is not x:
+        unlink(L, x)
+        link(L, x, False)
@@ -19,6 +19,10 @@ but increase the cost for inserting.
 
 Please note, that Python `list` is not implemented as a linked list. Internally Python
 lists are dynamic arrays.
+
+Nodes of long lists can be made **compact** by declaring their attributes in
+``__slots__``. Such nodes have no per-instance attribute dictionary and take about a third
+less memory, which matters when the list holds millions of small keys.
 """
 
 
@@ -44,6 +48,25 @@ class Node:
         return str(self.key)
 
 
+class CompactNode:
+    """Node of a doubly linked list with attributes stored in slots.
+    """
+    __slots__ = ("key", "next", "prev")
+
+    def __init__(self, key):
+        """Node of a doubly linked list with attributes stored in slots.
+
+        :param object key: Node's key.
+
+        """
+        self.key = key
+        self.next = None
+        self.prev = None
+
+    def __str__(self):
+        return str(self.key)
+
+
 class LinkedList:
     """Basic implementation of a doubly linked list, holds a pointer to its head.
     """
@@ -0,0 +1,238 @@
+"""
+Min-Max Heap
+============
+
+Min-max heap is a **double-ended priority queue** that provides fast access to both the
+smallest and the largest element. Like a binary heap, it is a nearly complete binary tree
+stored in an array, with children of a node at index :math:`i` stored at indices
+:math:`2i + 1` and :math:`2i + 2`.
+
+Levels of the tree alternate between *min levels* and *max levels*, starting with a min
+level at the root. A node on a min level is smaller than or equal to all of its
+descendants, and a node on a max level is larger than or equal to all of its descendants.
+Thus, the smallest element is at the root, and the largest element is one of the root's
+children.
+
+Sifting compares an element with its grandchildren (or grandparents), since those are on
+a level of the same kind. An element that moves past a level of the opposite kind may need
+to be exchanged with its parent once. Both operations take :math:`O(\\log n)` time, and
+the heap can be built bottom-up in linear time, just like a binary heap.
+"""
+
+
+def min_level(i):
+    """Evaluates if a node is on a min level.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param int i: Index of a node.
+    :return: :data:`True` if a level of a node is even.
+
+    """
+    return (i + 1).bit_length() % 2 == 1
+
+
+def push_down(A, i):
+    """Lets the value at :math:`A[i]` "sink" to its appropriate position.
+
+    The algorithm assumes that subtrees rooted at the children of :math:`A[i]` are
+    min-max heaps.
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param list A: Array to heapify.
+    :param int i: Integer index of an element to "sink".
+
+    """
+    n = len(A)
+    lt = min_level(i)  # Sinking on min levels looks for smaller descendants
+    while 2 * i + 1 < n:
+        m = 2 * i + 1  # Index of the extreme child or grandchild
+        for j in (2 * i + 2, 4 * i + 3, 4 * i + 4, 4 * i + 5, 4 * i + 6):
+            if j < n and (A[j] < A[m] if lt else A[m] < A[j]):
+                m = j
+        if not (A[m] < A[i] if lt else A[i] < A[m]):
+            break
+        A[i], A[m] = A[m], A[i]
+        if m <= 2 * i + 2:  # `m` is a child, no further descendants to compare with
+            break
+        p = (m - 1) // 2
+        if A[p] < A[m] if lt else A[m] < A[p]:  # Element does not fit below its parent
+            A[m], A[p] = A[p], A[m]
+        i = m
+
+
+def push_up(A, i):
+    """Causes the value at :math:`A[i]` to "bubble up" to its appropriate position.
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param list A: Array to heapify.
+    :param int i: Integer index of an element to bubble up.
+
+    """
+    if i == 0:
+        return
+    p = (i - 1) // 2
+    lt = min_level(i)
+    if A[p] < A[i] if lt else A[i] < A[p]:  # Element belongs to the levels of its parent
+        A[i], A[p] = A[p], A[i]
+        i = p
+        lt = not lt
+    while i > 2:  # Climb through grandparents
+        g = (i - 3) // 4
+        if not (A[i] < A[g] if lt else A[g] < A[i]):
+            break
+        A[i], A[g] = A[g], A[i]
+        i = g
+
+
+def build_min_max_heap(A):
+    """Rearranges an array into a representation of a min-max heap.
+
+    Complexity:
+        :math:`O(n)`.
+
+    :param list A: Array to heapify.
+
+    """
+    for i in range((len(A) - 2) // 2, -1, -1):
+        push_down(A, i)
+
+
+def max_index(A):
+    """Returns the index of the largest element in a min-max heap.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param list A: Min-max heap.
+    :return: Index of the largest element.
+
+    """
+    n = len(A)
+    if n == 0:
+        raise ValueError("Empty heap")
+    if n <= 2:
+        return n - 1
+    return 1 if A[2] < A[1] else 2
+
+
+def min_max_heap_min(A):
+    """Returns the smallest element without removing it.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param list A: Min-max heap.
+    :return: The smallest element.
+
+    """
+    if len(A) == 0:
+        raise ValueError("Empty heap")
+    return A[0]
+
+
+def min_max_heap_max(A):
+    """Returns the largest element without removing it.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param list A: Min-max heap.
+    :return: The largest element.
+
+    """
+    return A[max_index(A)]
+
+
+def min_max_heap_insert(A, z):
+    """Inserts a new element into a min-max heap.
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param list A: Min-max heap.
+    :param object z: A new element.
+
+    """
+    A.append(z)
+    push_up(A, len(A) - 1)
+
+
+def min_max_heap_extract_min(A):
+    """Removes the smallest element from a min-max heap and returns it.
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param list A: Min-max heap.
+    :return: The smallest element.
+
+    """
+    if len(A) == 0:
+        raise ValueError("Heap underflow")
+    x = A[0]
+    z = A.pop()  # Move bottom element to the top
+    if len(A) > 0:
+        A[0] = z
+        push_down(A, 0)
+    return x
+
+
+def min_max_heap_extract_max(A):
+    """Removes the largest element from a min-max heap and returns it.
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param list A: Min-max heap.
+    :return: The largest element.
+
+    """
+    if len(A) == 0:
+        raise ValueError("Heap underflow")
+    i = max_index(A)
+    x = A[i]
+    z = A.pop()  # Move bottom element in place of the largest one
+    if i < len(A):
+        A[i] = z
+        push_down(A, i)
+    return x
+
+
+def min_max_heap_insert_bounded(A, z, n, evict_max=True):
+    """Inserts a new element into a min-max heap holding at most :math:`n` elements.
+
+    When the heap is full, the worst element is evicted: the largest one by default, or
+    the smallest one. If the new element is itself the worst, it is rejected.
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param list A: Min-max heap.
+    :param object z: A new element.
+    :param int n: Maximum number of elements.
+    :param bool evict_max: (optional) Evict the largest element if :data:`True`, the
+     smallest one otherwise.
+    :return: Evicted element or :data:`None`.
+
+    """
+    if len(A) < n:
+        min_max_heap_insert(A, z)
+        return None
+    if n == 0:
+        return z
+    if evict_max:
+        if not z < min_max_heap_max(A):
+            return z
+        x = min_max_heap_extract_max(A)
+    else:
+        if not A[0] < z:
+            return z
+        x = min_max_heap_extract_min(A)
+    min_max_heap_insert(A, z)
+    return x
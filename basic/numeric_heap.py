@@ -0,0 +1,200 @@
+"""
+Numeric Heap
+============
+
+A heap of Python objects stores a pointer to every element and compares elements through
+their comparison operators. For :data:`Vertex` objects, every comparison is a call to
+:meth:`Vertex.__lt__`. When priorities are plain numbers, both the memory and the time
+spent on comparisons can be cut down substantially.
+
+This heap keeps priorities in a typed :mod:`array` of machine doubles (or 64-bit
+integers) and an associated integer *payload*, such as a vertex index, in a parallel
+typed array. An entry takes 16 bytes instead of a pointer to a boxed number, a pointer to
+an object and the object itself. Entries of both arrays are always moved together.
+
+A heap can also be built in bulk from any buffer of numbers, such as a
+:data:`numpy.ndarray`, without creating a Python object for every entry.
+"""
+from array import array
+
+
+class NumericHeap:
+    """Binary min-heap of numeric priorities with integer payloads in parallel arrays.
+    """
+    K = None  # Priorities
+    P = None  # Payloads
+
+    def __init__(self, typecode="d"):
+        """Binary min-heap of numeric priorities with integer payloads.
+
+        :param str typecode: (optional) Type of priorities, ``"d"`` for doubles or ``"q"``
+         for 64-bit integers.
+
+        """
+        self.K = array(typecode)
+        self.P = array("q")
+
+    def __len__(self):
+        return len(self.K)
+
+
+def typed_array(typecode, S):
+    """Copies a sequence of numbers into a typed array.
+
+    Objects supporting the buffer protocol with a matching item format, such as NumPy
+    arrays of ``float64`` or ``int64``, are copied as raw memory.
+
+    Complexity:
+        :math:`O(n)`.
+
+    :param str typecode: Type code of the array.
+    :param S: Sequence or buffer of numbers.
+    :return: :class:`array.array` instance.
+
+    """
+    A = array(typecode)
+    try:
+        m = memoryview(S)
+    except TypeError:
+        m = None
+    if m is not None and m.ndim == 1 and m.itemsize == A.itemsize:
+        f = m.format.lstrip("@=")
+        if f == typecode or (f in "bhilq" and typecode in "bhilq"):  # Same signed type
+            A.frombytes(m.tobytes())  # C-contiguous copy of the raw buffer
+            return A
+    A.extend(S)
+    return A
+
+
+def sift_up(H, i):
+    """Lets the entry at index :math:`i` "bubble up".
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param NumericHeap H: Numeric heap.
+    :param int i: Index of an entry.
+
+    """
+    K, P = H.K, H.P
+    k = K[i]
+    x = P[i]
+    while i > 0:
+        p = (i - 1) >> 1
+        if not k < K[p]:
+            break
+        K[i] = K[p]
+        P[i] = P[p]
+        i = p
+    K[i] = k
+    P[i] = x
+
+
+def sift_down(H, i):
+    """Lets the entry at index :math:`i` "sink".
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param NumericHeap H: Numeric heap.
+    :param int i: Index of an entry.
+
+    """
+    K, P = H.K, H.P
+    n = len(K)
+    k = K[i]
+    x = P[i]
+    while True:
+        c = 2 * i + 1
+        if c >= n:
+            break
+        if c + 1 < n and K[c + 1] < K[c]:
+            c += 1
+        if not K[c] < k:
+            break
+        K[i] = K[c]
+        P[i] = P[c]
+        i = c
+    K[i] = k
+    P[i] = x
+
+
+def numeric_heap_insert(H, k, x):
+    """Inserts a new entry into a numeric heap.
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param NumericHeap H: Numeric heap.
+    :param k: Numeric priority.
+    :param int x: Integer payload.
+
+    """
+    H.K.append(k)
+    H.P.append(x)
+    sift_up(H, len(H.K) - 1)
+
+
+def numeric_heap_minimum(H):
+    """Returns the entry with the smallest priority without removing it.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param NumericHeap H: Numeric heap.
+    :return: Tuple of the priority and the payload.
+
+    """
+    if len(H.K) == 0:
+        raise ValueError("Empty heap")
+    return H.K[0], H.P[0]
+
+
+def numeric_heap_extract(H):
+    """Removes the entry with the smallest priority and returns it.
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param NumericHeap H: Numeric heap.
+    :return: Tuple of the priority and the payload.
+
+    """
+    K, P = H.K, H.P
+    if len(K) == 0:
+        raise ValueError("Heap underflow")
+    k = K[0]
+    x = P[0]
+    z = K.pop()  # Move bottom entry to the top
+    y = P.pop()
+    if len(K) > 0:
+        K[0] = z
+        P[0] = y
+        sift_down(H, 0)
+    return k, x
+
+
+def build_numeric_heap(K, P=None, typecode="d"):
+    """Builds a numeric heap from arrays of priorities and payloads in bulk.
+
+    Both arrays are copied as raw memory when possible (see :func:`typed_array()`), then
+    arranged into a heap bottom-up, like in :func:`build_min_heap()`.
+
+    Complexity:
+        :math:`O(n)`.
+
+    :param K: Sequence or buffer of priorities, such as a :data:`numpy.ndarray`.
+    :param P: (optional) Sequence or buffer of integer payloads. Indices of the
+     priorities are used if omitted.
+    :param str typecode: (optional) Type of priorities, ``"d"`` or ``"q"``.
+    :return: :data:`NumericHeap` instance.
+
+    """
+    H = NumericHeap(typecode)
+    H.K = typed_array(typecode, K)
+    H.P = typed_array("q", range(len(H.K)) if P is None else P)
+    if len(H.P) != len(H.K):
+        raise ValueError("Priorities and payloads differ in length")
+    for i in range((len(H.K) - 2) // 2, -1, -1):
+        sift_down(H, i)
+    return H
@@ -0,0 +1,246 @@
+"""
+Pairing Heap
+============
+
+Pairing heap is a **mergeable heap**: in addition to the usual priority queue operations it
+supports *union* (or *meld*) of two heaps. It is a heap-ordered multiway tree with a very
+simple structure, where every node keeps a pointer to its leftmost child and to its next
+sibling. Children of a node form a doubly linked list, so any subtree can be cut off in
+constant time.
+
+The key operation is **linking** two trees: the root with the larger key becomes the
+leftmost child of the other root. Insertion, union and decrease-key are a single link.
+Extract-min removes the root and combines its children in **two passes**: first, the
+children are linked in pairs from left to right, then the resulting trees are linked one
+by one from right to left.
+
+Pairing heap is simpler and usually faster in practice than the Fibonacci heap, although
+its theoretical bound for decrease-key is weaker: :math:`O(\\log n)` amortized is proven,
+and :math:`O(1)` is conjectured and observed in practice.
+"""
+
+
+class Node:
+    """Node of a pairing heap.
+
+    Holds a key, an optional satellite item, a pointer to the leftmost child, to the next
+    sibling and to the previous node. The previous node is the left sibling or, for the
+    leftmost child, the parent.
+    """
+    key = None
+    item = None
+    child = None
+    sibling = None
+    prev = None
+
+    def __init__(self, key, item=None):
+        """Node of a pairing heap.
+
+        :param object key: Node's key.
+        :param object item: (optional) Satellite data.
+
+        """
+        self.key = key
+        self.item = item
+
+    def __str__(self):
+        return str(self.key)
+
+
+class PairingHeap:
+    """Pairing heap, holds a pointer to the root and the number of nodes.
+    """
+    root = None
+    n = 0
+
+    def __len__(self):
+        return self.n
+
+
+def link(x, y):
+    """Links two heap-ordered trees.
+
+    The root with the larger key becomes the leftmost child of the other root.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param basic.pairing_heap.Node x: Root of a tree.
+    :param basic.pairing_heap.Node y: Root of another tree.
+    :return: Root of the resulting tree.
+
+    """
+    if y is None:
+        return x
+    if x is None:
+        return y
+    if y.key < x.key:
+        x, y = y, x
+    y.prev = x
+    y.sibling = x.child
+    if x.child is not None:
+        x.child.prev = y
+    x.child = y
+    x.sibling = None
+    x.prev = None
+    return x
+
+
+def pairing_heap_minimum(H):
+    """Returns the node with the minimum key.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param PairingHeap H: Pairing heap.
+    :return: Node with the minimum key.
+
+    """
+    if H.root is None:
+        raise ValueError("Empty heap")
+    return H.root
+
+
+def pairing_heap_insert(H, x):
+    """Inserts a new node into a pairing heap.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param PairingHeap H: Pairing heap.
+    :param basic.pairing_heap.Node x: New node.
+    :return: Inserted node, which serves as its handle.
+
+    """
+    x.child = None
+    x.sibling = None
+    x.prev = None
+    H.root = link(H.root, x)
+    H.n += 1
+    return x
+
+
+def pairing_heap_union(H1, H2):
+    """Melds two pairing heaps into a new one.
+
+    Both input heaps are destroyed in the process.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param PairingHeap H1: Pairing heap.
+    :param PairingHeap H2: Another pairing heap.
+    :return: Resulting :data:`PairingHeap`.
+
+    """
+    H = PairingHeap()
+    H.root = link(H1.root, H2.root)
+    H.n = H1.n + H2.n
+    return H
+
+
+def merge_pairs(x):
+    """Combines a list of sibling trees using the two-pass pairing strategy.
+
+    Complexity:
+        :math:`O(k)` where :math:`k` is the number of siblings, :math:`O(\\log n)`
+        amortized.
+
+    :param basic.pairing_heap.Node x: Leftmost sibling.
+    :return: Root of the combined tree.
+
+    """
+    pairs = []
+    while x is not None:  # First pass: link pairs from left to right
+        y = x.sibling
+        if y is None:
+            x.prev = None
+            pairs.append(x)
+            break
+        z = y.sibling
+        x.sibling = None
+        y.sibling = None
+        pairs.append(link(x, y))
+        x = z
+    r = None
+    for x in reversed(pairs):  # Second pass: link from right to left
+        r = link(x, r)
+    return r
+
+
+def pairing_heap_extract_min(H):
+    """Removes the node with the minimum key from a pairing heap.
+
+    Complexity:
+        :math:`O(\\log n)` amortized.
+
+    :param PairingHeap H: Pairing heap.
+    :return: Removed node.
+
+    """
+    z = H.root
+    if z is None:
+        raise ValueError("Heap underflow")
+    H.root = merge_pairs(z.child)
+    H.n -= 1
+    z.child = None
+    return z
+
+
+def cut(x):
+    """Detaches a subtree rooted at a non-root node from its parent or left sibling.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param basic.pairing_heap.Node x: Root of the subtree.
+
+    """
+    if x.prev.child is x:  # `x` is the leftmost child
+        x.prev.child = x.sibling
+    else:
+        x.prev.sibling = x.sibling
+    if x.sibling is not None:
+        x.sibling.prev = x.prev
+    x.sibling = None
+    x.prev = None
+
+
+def pairing_heap_decrease_key(H, x, k):
+    """Decreases the key of a node.
+
+    The subtree rooted at the node is cut off and linked with the root.
+
+    Complexity:
+        :math:`O(1)`, conjectured amortized.
+
+    :param PairingHeap H: Pairing heap.
+    :param basic.pairing_heap.Node x: Node to update.
+    :param object k: New key, not greater than the current one.
+
+    """
+    if x.key < k:
+        raise ValueError("New key is greater than current key")
+    x.key = k
+    if x is not H.root:
+        cut(x)
+        H.root = link(H.root, x)
+
+
+def pairing_heap_delete(H, x):
+    """Removes an arbitrary node from a pairing heap.
+
+    Complexity:
+        :math:`O(\\log n)` amortized.
+
+    :param PairingHeap H: Pairing heap.
+    :param basic.pairing_heap.Node x: Node to remove.
+
+    """
+    if x is H.root:
+        pairing_heap_extract_min(H)
+    else:
+        cut(x)
+        H.root = link(H.root, merge_pairs(x.child))
+        x.child = None
+        H.n -= 1
@@ -0,0 +1,214 @@
+"""
+Pooled Linked List
+==================
+
+Every node of :class:`basic.linked_list.LinkedList` is a separate Python object with
+three attributes. For a list of tens of millions of elements, the per-object overhead
+dominates the memory use and the nodes end up scattered all over the heap.
+
+When objects are not available, or are too expensive, a linked list can be represented
+with **multiple arrays**: a node is an index :math:`x`, and its key, next and previous
+pointers are stored in :math:`key[x]`, :math:`next[x]` and :math:`prev[x]`. Pointers are
+indices as well, with :data:`NIL` (:math:`-1`) used as the null pointer. Pointer arrays are
+typed :mod:`array` instances, so a node costs 16 bytes plus the reference to its key, or
+plus the key itself if keys are typed as well.
+
+Slots of deleted nodes are not returned to the memory allocator. They are kept in a singly
+linked **free list**, threaded through the :math:`next` array, and handed out again by
+subsequent insertions. When the free list runs out, the arrays double in size and the new
+slots are added to the free list.
+
+A list can also be built from a sequence in bulk. Keys are copied in a single pass and the
+pointer arrays are filled from ranges, without allocating any nodes one by one.
+"""
+from array import array
+
+NIL = -1  # Null pointer
+
+
+class PooledList:
+    """Doubly linked list stored in parallel arrays with a free list of unused slots.
+    """
+    key = []
+    next = None
+    prev = None
+    head = NIL
+    free = NIL  # Head of the free list
+    length = 0  # Number of nodes in the list
+    typecode = None  # Type of typed keys
+
+    def __init__(self, typecode=None):
+        """Doubly linked list stored in parallel arrays.
+
+        :param str typecode: (optional) Type code of an :class:`array.array` for the keys,
+         such as ``"q"`` for 64-bit integers. Keys are stored in a list if omitted.
+
+        """
+        self.key = [] if typecode is None else array(typecode)
+        self.next = array("q")
+        self.prev = array("q")
+        self.typecode = typecode
+
+    def __len__(self):
+        return self.length
+
+    def __str__(self):
+        out = ""
+        x = self.head
+        while x != NIL:
+            out += str(self.key[x])
+            out += "->"
+            x = self.next[x]
+        out += "null"
+        return out
+
+    def __iter__(self):
+        x = self.head
+        while x != NIL:
+            yield x
+            x = self.next[x]
+
+
+def grow(L):
+    """Doubles the capacity of the arrays of a pooled list and adds new slots to the free
+    list.
+
+    Complexity:
+        :math:`O(n)`, :math:`O(1)` amortized per allocated node.
+
+    :param PooledList L: An instance of a pooled list.
+
+    """
+    m = len(L.next)
+    s = max(2 * m, 16)
+    if L.typecode is None:
+        L.key.extend([None] * (s - m))
+    else:
+        L.key.extend(array(L.typecode, bytes((s - m) * L.key.itemsize)))
+    L.next.extend(range(m + 1, s + 1))
+    L.next[s - 1] = L.free
+    L.prev.extend(array("q", bytes((s - m) * 8)))
+    L.free = m
+
+
+def allocate_object(L):
+    """Takes a slot from the free list, growing the arrays if the free list is empty.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param PooledList L: An instance of a pooled list.
+    :return: Index of an unused slot.
+
+    """
+    if L.free == NIL:
+        grow(L)
+    x = L.free
+    L.free = L.next[x]
+    return x
+
+
+def free_object(L, x):
+    """Returns a slot to the free list.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param PooledList L: An instance of a pooled list.
+    :param int x: Index of a slot that is no longer used.
+
+    """
+    if L.typecode is None:
+        L.key[x] = None  # Release the reference
+    L.next[x] = L.free
+    L.free = x
+
+
+def list_search(L, k):
+    """Finds the first element with a given key in a pooled list.
+
+    Complexity:
+        :math:`O(n)`.
+
+    :param PooledList L: An instance of a pooled list.
+    :param object k: A key to search.
+    :return: Index of a node or :data:`NIL` if key was not found.
+
+    """
+    key, nxt = L.key, L.next
+    x = L.head
+    while x != NIL and key[x] != k:
+        x = nxt[x]
+    return x
+
+
+def list_insert(L, k):
+    """Inserts a new node with a given key at the head of a pooled list.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param PooledList L: An instance of a pooled list.
+    :param object k: Key of a new node.
+    :return: Index of the new node.
+
+    """
+    x = allocate_object(L)
+    L.key[x] = k
+    L.next[x] = L.head
+    if L.head != NIL:
+        L.prev[L.head] = x
+    L.head = x
+    L.prev[x] = NIL
+    L.length += 1
+    return x
+
+
+def list_delete(L, x):
+    """Removes a node from a pooled list and frees its slot.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param PooledList L: An instance of a pooled list.
+    :param int x: Index of a node to remove.
+
+    """
+    nxt, prev = L.next, L.prev
+    if prev[x] != NIL:
+        nxt[prev[x]] = nxt[x]
+    else:
+        L.head = nxt[x]
+    if nxt[x] != NIL:
+        prev[nxt[x]] = prev[x]
+    L.length -= 1
+    free_object(L, x)
+
+
+def build_pooled_list(S, typecode=None):
+    """Builds a pooled list from a sequence of keys, keeping their order.
+
+    Node of the :math:`i`-th key is stored at index :math:`i`, so the pointer arrays are
+    filled straight from ranges.
+
+    Complexity:
+        :math:`O(n)`.
+
+    :param S: Iterable of keys, the first one becomes the head of the list.
+    :param str typecode: (optional) Type code of an :class:`array.array` for the keys.
+    :return: :data:`PooledList` instance.
+
+    """
+    L = PooledList(typecode)
+    if typecode is None:
+        L.key = list(S)
+    else:
+        L.key = array(typecode, S)
+    n = len(L.key)
+    if n > 0:
+        L.next = array("q", range(1, n + 1))
+        L.next[n - 1] = NIL
+        L.prev = array("q", range(-1, n - 1))
+        L.head = 0
+    L.length = n
+    return L
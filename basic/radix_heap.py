@@ -0,0 +1,171 @@
+"""
+Radix Heap
+==========
+
+Radix heap is a **monotone priority queue** for non-negative integer keys. A priority
+queue is *monotone* if an extracted key is never smaller than the previously extracted
+one, which means that no key smaller than the last extracted minimum is ever inserted.
+Dijkstra's algorithm with non-negative integer weights uses its priority queue exactly this
+way.
+
+Radix heap keeps the last extracted key :math:`l` and distributes the elements among
+buckets by the position of the highest bit in which their key differs from :math:`l`.
+Bucket :math:`0` holds the keys equal to :math:`l`, bucket :math:`i` holds the keys
+:math:`k` such that the highest set bit of :math:`k \\oplus l` is bit :math:`i - 1`.
+Every key in bucket :math:`i` is smaller than every key in bucket :math:`i + 1`.
+
+Extract-min takes an element from bucket :math:`0`. If the bucket is empty, the first
+non-empty bucket is located, its minimum becomes the new :math:`l`, and the elements of
+the bucket are redistributed. Since all of them share the bits above the highest
+differing bit with the new :math:`l`, every element moves to a strictly lower bucket. An
+element moves at most :math:`\\log C` times during its life, where :math:`C` is the
+largest key, which gives :math:`O(\\log C)` amortized extract-min. Apart from finding
+the minimum of a single bucket, no key comparisons are made.
+"""
+
+
+class Node:
+    """Node of a radix heap.
+
+    Holds a key, an optional satellite item and the position of the node: the index of its
+    bucket and its index within the bucket.
+    """
+    key = 0
+    item = None
+    b = -1  # Bucket index
+    i = -1  # Index within the bucket
+
+    def __init__(self, key, item=None):
+        """Node of a radix heap.
+
+        :param int key: Node's key.
+        :param object item: (optional) Satellite data.
+
+        """
+        self.key = key
+        self.item = item
+
+    def __str__(self):
+        return str(self.key)
+
+
+class RadixHeap:
+    """Radix heap, holds the buckets, the last extracted key and the number of nodes.
+    """
+    B = []  # Buckets
+    last = 0  # Last extracted key
+    n = 0
+
+    def __init__(self):
+        """Radix heap, holds the buckets, the last extracted key and the number of nodes.
+        """
+        self.B = [[]]
+
+    def __len__(self):
+        return self.n
+
+
+def bucket(H, x):
+    """Puts a node into the bucket that corresponds to its key.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param RadixHeap H: Radix heap.
+    :param basic.radix_heap.Node x: Node to place.
+
+    """
+    b = (x.key ^ H.last).bit_length()  # Index of the highest differing bit plus one
+    while b >= len(H.B):
+        H.B.append([])
+    x.b = b
+    x.i = len(H.B[b])
+    H.B[b].append(x)
+
+
+def unbucket(H, x):
+    """Removes a node from its bucket by moving the last node of the bucket in its place.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param RadixHeap H: Radix heap.
+    :param basic.radix_heap.Node x: Node to remove.
+
+    """
+    L = H.B[x.b]
+    y = L.pop()
+    if y is not x:
+        L[x.i] = y
+        y.i = x.i
+    x.b = -1
+    x.i = -1
+
+
+def radix_heap_insert(H, x):
+    """Inserts a new node into a radix heap.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param RadixHeap H: Radix heap.
+    :param basic.radix_heap.Node x: New node, its key may not be smaller than the last
+     extracted key.
+    :return: Inserted node, which serves as its handle.
+
+    """
+    if x.key < H.last:
+        raise ValueError("Key is smaller than the last extracted key")
+    bucket(H, x)
+    H.n += 1
+    return x
+
+
+def radix_heap_extract_min(H):
+    """Removes the node with the minimum key from a radix heap.
+
+    Complexity:
+        :math:`O(\\log C)` amortized, where :math:`C` is the largest key.
+
+    :param RadixHeap H: Radix heap.
+    :return: Removed node.
+
+    """
+    if H.n == 0:
+        raise ValueError("Heap underflow")
+    B = H.B
+    if len(B[0]) == 0:
+        b = 1
+        while len(B[b]) == 0:  # First non-empty bucket
+            b += 1
+        L = B[b]
+        B[b] = []
+        H.last = min(x.key for x in L)
+        for x in L:  # Every node moves to a lower bucket
+            bucket(H, x)
+    x = B[0].pop()
+    x.b = -1
+    x.i = -1
+    H.n -= 1
+    return x
+
+
+def radix_heap_decrease_key(H, x, k):
+    """Decreases the key of a node and moves it to a corresponding bucket.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param RadixHeap H: Radix heap.
+    :param basic.radix_heap.Node x: Node to update.
+    :param int k: New key, not greater than the current one and not smaller than the last
+     extracted key.
+
+    """
+    if x.key < k:
+        raise ValueError("New key is greater than current key")
+    if k < H.last:
+        raise ValueError("Key is smaller than the last extracted key")
+    unbucket(H, x)
+    x.key = k
+    bucket(H, x)
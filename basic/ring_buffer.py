@@ -0,0 +1,197 @@
+"""
+Ring Buffer
+===========
+
+Ring buffer (or circular buffer) is an array that is used as if its ends were connected.
+Like the fixed size :class:`basic.fifo.Queue`, it keeps an index of the head of the queue
+and the number of enqueued elements, and both indices wrap around the end of the array.
+
+A fixed size queue must be allocated for the worst case. This implementation behaves like
+a dynamic table instead: the array **doubles** when it is full and **halves** when it
+becomes less than a quarter full, so the allocated memory stays proportional to the
+number of enqueued elements and every operation takes :math:`O(1)` amortized time.
+
+Capacity of the array is always a power of two. Wrapping an index around then takes a
+single bitwise AND with the *mask* :math:`capacity - 1` instead of a comparison or a
+division.
+
+Bulk operations move whole slices of elements at once. Since the occupied part of the
+array is split in at most two contiguous runs, any number of elements is copied with at
+most two slice assignments.
+"""
+
+
+class RingBuffer:
+    """Growable FIFO queue backed by a power-of-two circular array.
+    """
+    head = 0
+    length = 0  # Number of currently enqueued items
+    items = []
+    mask = 0  # Capacity minus one
+    minsize = 0  # Array never shrinks below this capacity
+
+    def __init__(self, n=16):
+        """Growable FIFO queue backed by a power-of-two circular array.
+
+        :param int n: (optional) Initial capacity, rounded up to a power of two.
+
+        """
+        s = 1 << max(n - 1, 0).bit_length()
+        self.items = [None] * s
+        self.mask = s - 1
+        self.minsize = s
+
+
+def resize(Q, s):
+    """Re-allocates the array of a ring buffer, moving the elements to its beginning.
+
+    Complexity:
+        :math:`O(n)` where :math:`n` is the number of enqueued elements.
+
+    :param RingBuffer Q: Instance of a ring buffer.
+    :param int s: New capacity, a power of two not less than the number of elements.
+
+    """
+    items = [None] * s
+    items[:Q.length] = dequeue_view(Q, Q.length)
+    Q.items = items
+    Q.head = 0
+    Q.mask = s - 1
+
+
+def dequeue_view(Q, m):
+    """Returns the first :math:`m` elements of a ring buffer without removing them.
+
+    Complexity:
+        :math:`O(m)`.
+
+    :param RingBuffer Q: Instance of a ring buffer.
+    :param int m: Number of elements, not greater than the length of the queue.
+    :return: List of elements starting at the head.
+
+    """
+    h = Q.head
+    e = h + m
+    s = Q.mask + 1
+    if e <= s:
+        return Q.items[h:e]
+    return Q.items[h:] + Q.items[:e - s]  # Occupied part wraps around
+
+
+def enqueue(Q, x):
+    """Adds an element at the tail of the queue, growing the array if it is full.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param RingBuffer Q: Instance of a ring buffer.
+    :param object x: An element to insert at a tail of the queue.
+
+    """
+    if Q.length > Q.mask:
+        resize(Q, 2 * (Q.mask + 1))
+    Q.items[(Q.head + Q.length) & Q.mask] = x
+    Q.length += 1
+
+
+def dequeue(Q):
+    """Removes an element from the head of the queue and returns it.
+
+    The array is halved once it becomes less than a quarter full.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param RingBuffer Q: Instance of a ring buffer.
+    :return: Removed element.
+
+    """
+    if Q.length == 0:
+        raise ValueError("Queue underflow")
+    x = Q.items[Q.head]
+    Q.items[Q.head] = None  # Release the reference
+    Q.head = (Q.head + 1) & Q.mask
+    Q.length -= 1
+    shrink(Q)
+    return x
+
+
+def next(Q):
+    """Returns current element at the head of the queue without removing it.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param RingBuffer Q: Instance of a ring buffer.
+    :return: An element at the head of the queue.
+
+    """
+    if Q.length == 0:
+        raise ValueError("Empty queue")
+    return Q.items[Q.head]
+
+
+def shrink(Q):
+    """Halves the array while it is less than a quarter full.
+
+    Complexity:
+        :math:`O(n)` on contraction, :math:`O(1)` amortized.
+
+    :param RingBuffer Q: Instance of a ring buffer.
+
+    """
+    s = Q.mask + 1
+    if s > Q.minsize and Q.length < s // 4:
+        while s > Q.minsize and Q.length < s // 4:
+            s //= 2
+        resize(Q, s)
+
+
+def enqueue_many(Q, L):
+    """Adds a sequence of elements at the tail of the queue.
+
+    The array grows at most once, then the elements are copied with at most two slice
+    assignments.
+
+    Complexity:
+        :math:`O(m)` amortized, where :math:`m` is the number of added elements.
+
+    :param RingBuffer Q: Instance of a ring buffer.
+    :param list L: Elements to insert, in order.
+
+    """
+    m = len(L)
+    s = Q.mask + 1
+    if Q.length + m > s:
+        while Q.length + m > s:
+            s *= 2
+        resize(Q, s)
+    t = (Q.head + Q.length) & Q.mask  # Tail index
+    k = min(m, s - t)  # Number of elements that fit before the end of the array
+    Q.items[t:t + k] = L[:k]
+    Q.items[:m - k] = L[k:]
+    Q.length += m
+
+
+def dequeue_many(Q, m):
+    """Removes up to :math:`m` elements from the head of the queue.
+
+    Complexity:
+        :math:`O(m)` amortized.
+
+    :param RingBuffer Q: Instance of a ring buffer.
+    :param int m: Maximum number of elements to remove.
+    :return: List of removed elements, in order.
+
+    """
+    m = min(m, Q.length)
+    L = dequeue_view(Q, m)
+    h = Q.head
+    s = Q.mask + 1
+    k = min(m, s - h)
+    Q.items[h:h + k] = [None] * k  # Release the references
+    Q.items[:m - k] = [None] * (m - k)
+    Q.head = (h + m) & Q.mask
+    Q.length -= m
+    shrink(Q)
+    return L
@@ -0,0 +1,242 @@
+"""
+Shared Memory Ring Buffer
+=========================
+
+Processes do not share memory by default. A queue between processes, such as
+:class:`multiprocessing.Queue`, serializes every element, sends the bytes through a pipe
+and deserializes them on the other side. For small records, serialization dominates the
+cost of the transfer.
+
+This ring buffer lives in a block of **shared memory** mapped into every participating
+process. It carries fixed-size records described by a :mod:`struct` format, such as
+``"q"`` for a single 64-bit integer or ``"qd"`` for an integer and a double. Records are
+packed directly into the shared block and unpacked directly from it, with no pipes and no
+serialization of Python objects.
+
+The layout follows the head and tail indexing of :class:`basic.fifo.Queue`, except that
+both indices are running counters that never wrap: the slot of a counter :math:`c` is
+:math:`c \\bmod n`, the number of stored records is :math:`tail - head`, and the buffer is
+full when it equals :math:`n`. The counters are kept on separate cache lines, so that the
+producer and the consumer do not invalidate each other's caches on every update.
+
+With a **single producer and a single consumer** (SPSC), no locking is needed. Only the
+producer writes the tail, and only the consumer writes the head. The producer writes a
+record before it advances the tail, and the consumer reads a record before it advances the
+head, so neither side ever sees a half-written slot. This relies on stores becoming
+visible to other processors in program order, which holds on x86. Other processors, such as
+ARM, may reorder stores, and Python has no memory fences to prevent it. There, every
+buffer uses a single inter-process lock for producers and consumers alike, since acquiring
+and releasing a lock orders the memory accesses around it. Counters are accessed
+through a memoryview of 64-bit integers, so every update is a single aligned store.
+:meth:`struct.Struct.pack_into` would not do: it clears the target bytes before writing,
+and the other side could read a zero in between.
+
+With **multiple producers or consumers** (MPMC), each side serializes its updates with an
+inter-process lock.
+"""
+import multiprocessing
+import platform
+import struct
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+HEAD = 0  # Index of the head counter
+TAIL = 8  # Index of the tail counter, on its own 64-byte cache line
+DATA = 128  # Offset of the first slot in bytes
+ORDERED_STORES = platform.machine().lower() in ("x86_64", "amd64", "i386", "i686", "x86")
+
+
+class SharedRingBuffer:
+    """Fixed-capacity ring buffer of fixed-size records in shared memory.
+
+    The instance can be passed to a child process as an argument, where it attaches to
+    the same block of shared memory.
+
+    Lock-free operation depends on the in-order store visibility of x86 processors. On
+    other platforms, see :data:`ORDERED_STORES`, producers and consumers share a single
+    lock in every mode, which makes the buffer correct there at the cost of contention.
+    """
+    n = 0  # Capacity in records
+    fmt = ""  # Record format
+    record = None  # Compiled record format
+    shm = None
+    buf = None
+    counters = None  # Header viewed as an array of 64-bit integers
+    put_lock = None  # Producers lock, MPMC only
+    get_lock = None  # Consumers lock, MPMC only
+
+    def __init__(self, n, fmt="q", multi=False, ctx=None, name=None, locks=None):
+        """Fixed-capacity ring buffer of fixed-size records in shared memory.
+
+        :param int n: Capacity in records.
+        :param str fmt: (optional) :mod:`struct` format of a record.
+        :param bool multi: (optional) Allow multiple producers and consumers.
+        :param ctx: (optional) Multiprocessing context of the processes sharing the buffer,
+         used to create the locks.
+        :param str name: (optional) Name of an existing shared memory block to attach to.
+         A new block is created if omitted.
+        :param tuple locks: (optional) Producer and consumer locks of an existing buffer.
+
+        """
+        self.n = n
+        self.fmt = fmt
+        self.record = struct.Struct(fmt)
+        if name is None:
+            self.shm = SharedMemory(create=True, size=DATA + n * self.record.size)
+            self.shm.buf[:DATA] = bytes(DATA)
+        else:
+            self.shm = SharedMemory(name=name)
+        self.buf = self.shm.buf
+        self.counters = self.buf[:DATA].cast("q")
+        if locks is not None:
+            self.put_lock, self.get_lock = locks
+        elif not ORDERED_STORES:  # Lock both sides with the same lock for memory ordering
+            ctx = ctx or multiprocessing.get_context()
+            self.put_lock = self.get_lock = ctx.Lock()
+        elif multi:
+            ctx = ctx or multiprocessing.get_context()
+            self.put_lock = ctx.Lock()
+            self.get_lock = ctx.Lock()
+
+    def __reduce__(self):
+        locks = None if self.put_lock is None else (self.put_lock, self.get_lock)
+        return SharedRingBuffer, (self.n, self.fmt, False, None, self.shm.name, locks)
+
+    def __del__(self):
+        if self.counters is not None:
+            self.counters.release()  # Lets the block be unmapped
+
+    def __len__(self):
+        return self.counters[TAIL] - self.counters[HEAD]
+
+
+def put_many(R, L):
+    """Appends as many records as fit into the buffer without waiting.
+
+    Complexity:
+        :math:`O(m)` where :math:`m` is the number of records.
+
+    :param SharedRingBuffer R: Shared ring buffer.
+    :param list[tuple] L: Records to append.
+    :return: Number of appended records.
+
+    """
+    if R.put_lock is not None:
+        with R.put_lock:
+            return write(R, L)
+    return write(R, L)
+
+
+def write(R, L):
+    """Packs records into free slots and publishes them by advancing the tail.
+
+    :param SharedRingBuffer R: Shared ring buffer.
+    :param list[tuple] L: Records to append.
+    :return: Number of appended records.
+
+    """
+    buf, n, pack_into, size = R.buf, R.n, R.record.pack_into, R.record.size
+    t = R.counters[TAIL]
+    m = min(len(L), n - (t - R.counters[HEAD]))
+    for i in range(m):
+        pack_into(buf, DATA + ((t + i) % n) * size, *L[i])
+    R.counters[TAIL] = t + m  # Records become visible to consumers
+    return m
+
+
+def get_many(R, m):
+    """Removes up to :math:`m` records from the buffer without waiting.
+
+    Complexity:
+        :math:`O(m)`.
+
+    :param SharedRingBuffer R: Shared ring buffer.
+    :param int m: Maximum number of records.
+    :return: List of records as tuples.
+
+    """
+    if R.get_lock is not None:
+        with R.get_lock:
+            return read(R, m)
+    return read(R, m)
+
+
+def read(R, m):
+    """Unpacks records from occupied slots and releases them by advancing the head.
+
+    Records are unpacked straight from the shared block in at most two contiguous runs.
+
+    :param SharedRingBuffer R: Shared ring buffer.
+    :param int m: Maximum number of records.
+    :return: List of records as tuples.
+
+    """
+    buf, n, size = R.buf, R.n, R.record.size
+    h = R.counters[HEAD]
+    m = min(m, R.counters[TAIL] - h)
+    i = h % n
+    k = min(m, n - i)  # Records before the end of the block
+    L = list(R.record.iter_unpack(buf[DATA + i * size:DATA + (i + k) * size]))
+    if k < m:
+        L.extend(R.record.iter_unpack(buf[DATA:DATA + (m - k) * size]))
+    R.counters[HEAD] = h + m  # Slots become available to producers
+    return L
+
+
+def put(R, x, timeout=None):
+    """Appends a record, waiting for a free slot if the buffer is full.
+
+    Waiting is a polling loop with an exponential back-off of up to a millisecond.
+
+    :param SharedRingBuffer R: Shared ring buffer.
+    :param tuple x: Record to append.
+    :param float timeout: (optional) Maximum time to wait in seconds.
+
+    """
+    wait(lambda: put_many(R, [x]) == 1, timeout, "Buffer is full")
+
+
+def get(R, timeout=None):
+    """Removes a record, waiting for one to appear if the buffer is empty.
+
+    :param SharedRingBuffer R: Shared ring buffer.
+    :param float timeout: (optional) Maximum time to wait in seconds.
+    :return: Record as a tuple.
+
+    """
+    L = []
+    wait(lambda: L.extend(get_many(R, 1)) or len(L) == 1, timeout, "Buffer is empty")
+    return L[0]
+
+
+def wait(f, timeout, message):
+    """Polls a function until it succeeds, backing off exponentially.
+
+    :param ()->bool f: Function to poll.
+    :param float timeout: Maximum time to wait in seconds or :data:`None`.
+    :param str message: Error message on timeout.
+
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = 0.0
+    while not f():
+        if deadline is not None and time.monotonic() > deadline:
+            raise TimeoutError(message)
+        time.sleep(delay)
+        delay = min(max(2 * delay, 1e-6), 1e-3)
+
+
+def close(R, unlink=False):
+    """Detaches from the shared memory block.
+
+    :param SharedRingBuffer R: Shared ring buffer.
+    :param bool unlink: (optional) Also destroy the block, which must be done exactly
+     once, by the process that created it.
+
+    """
+    R.counters.release()
+    R.counters = None
+    R.buf = None
+    R.shm.close()
+    if unlink:
+        R.shm.unlink()
@@ -0,0 +1,289 @@
+"""
+Skip List
+=========
+
+Skip list is an ordered linked list with **express lanes**. Every node is on the bottom
+level, a sorted linked list of all the keys. A node is also promoted to the next level
+with probability :math:`p`, and then again, so level :math:`i` holds about :math:`p^i` of
+the nodes. A search starts on the top level, moves forward while the next key is smaller
+than the target, then drops a level and continues. On every level, the search is expected
+to pass only :math:`1/p` nodes, and there are :math:`\\log_{1/p} n` levels, so search,
+insertion and deletion take :math:`O(\\log n)` expected time.
+
+Skip lists need no rotations or other rebalancing: the balance is provided by the coin
+flips. Insertion and deletion only relink the neighbors of a single node on each of its
+levels, which is why concurrent ordered maps are often built on skip lists, since the
+changes to the structure stay local.
+
+The probability :math:`p` trades memory for speed. With :math:`p=1/2` a node has two
+forward pointers on average, with :math:`p=1/4` it has :math:`4/3` and searches pass a few
+more nodes per level.
+
+Bottom level is doubly linked, so that the list can be traversed backwards from any node.
+A skip list can also be built from sorted input in linear time, by appending every node to
+the end of each of its levels.
+"""
+import random
+from itertools import repeat
+
+
+class Node:
+    """Node of a skip list.
+    """
+    key = None
+    value = None
+    next = []  # Forward pointers, one per level of a node
+    prev = None  # Backward pointer on the bottom level
+
+    def __init__(self, key, value, level):
+        """Node of a skip list.
+
+        :param object key: Node's key.
+        :param object value: Value associated with the key.
+        :param int level: Number of levels of a node.
+
+        """
+        self.key = key
+        self.value = value
+        self.next = [None] * level
+
+    def __str__(self):
+        return str(self.key)
+
+
+class SkipList:
+    """Ordered map represented by a skip list.
+
+    Holds a sentinel head node with the maximum number of levels.
+    """
+    head = None
+    level = 1  # Number of levels in use
+    max_level = 32
+    p = 0.5  # Probability of promoting a node to the next level
+    n = 0
+
+    def __init__(self, p=0.5, max_level=32):
+        """Ordered map represented by a skip list.
+
+        :param float p: (optional) Probability of promoting a node to the next level.
+        :param int max_level: (optional) Maximum number of levels.
+
+        """
+        if not 0 < p < 1:
+            raise ValueError("Probability must be between 0 and 1")
+        self.head = Node(None, None, max_level)
+        self.max_level = max_level
+        self.p = p
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        x = self.head.next[0]
+        while x is not None:
+            yield x
+            x = x.next[0]
+
+
+def random_level(L):
+    """Draws the number of levels of a new node.
+
+    Complexity:
+        :math:`O(1)` expected.
+
+    :param SkipList L: Skip list.
+    :return: Number of levels, at least one.
+
+    """
+    i = 1
+    while i < L.max_level and random.random() < L.p:
+        i += 1
+    return i
+
+
+def find(L, k):
+    """Finds the last node before a given key on every level.
+
+    Complexity:
+        :math:`O(\\log n)` expected.
+
+    :param SkipList L: Skip list.
+    :param object k: A key to search.
+    :return: List of the rightmost nodes with keys smaller than :math:`k`, bottom level
+     first.
+
+    """
+    U = [L.head] * L.level
+    x = L.head
+    for i in range(L.level - 1, -1, -1):
+        y = x.next[i]
+        while y is not None and y.key < k:
+            x = y
+            y = x.next[i]
+        U[i] = x
+    return U
+
+
+def skip_search(L, k):
+    """Finds a node with a given key.
+
+    Complexity:
+        :math:`O(\\log n)` expected.
+
+    :param SkipList L: Skip list.
+    :param object k: A key to search.
+    :return: A found node or :data:`None` if a key was not found.
+
+    """
+    x = L.head
+    for i in range(L.level - 1, -1, -1):
+        y = x.next[i]
+        while y is not None and y.key < k:
+            x = y
+            y = x.next[i]
+    x = x.next[0]
+    if x is not None and x.key == k:
+        return x
+    return None
+
+
+def skip_insert(L, k, v=None):
+    """Inserts a key with a value, or replaces the value if the key is present.
+
+    Complexity:
+        :math:`O(\\log n)` expected.
+
+    :param SkipList L: Skip list.
+    :param object k: Key.
+    :param object v: (optional) Value.
+    :return: Node holding the key.
+
+    """
+    U = find(L, k)
+    x = U[0].next[0]
+    if x is not None and x.key == k:
+        x.value = v
+        return x
+    m = random_level(L)
+    if m > L.level:
+        U.extend([L.head] * (m - L.level))
+        L.level = m
+    z = Node(k, v, m)
+    for i in range(m):
+        z.next[i] = U[i].next[i]
+        U[i].next[i] = z
+    if U[0] is not L.head:
+        z.prev = U[0]
+    if z.next[0] is not None:
+        z.next[0].prev = z
+    L.n += 1
+    return z
+
+
+def skip_delete(L, k):
+    """Removes a key from a skip list.
+
+    Complexity:
+        :math:`O(\\log n)` expected.
+
+    :param SkipList L: Skip list.
+    :param object k: Key to remove.
+    :return: Removed node or :data:`None` if a key was not found.
+
+    """
+    U = find(L, k)
+    x = U[0].next[0]
+    if x is None or x.key != k:
+        return None
+    for i in range(len(x.next)):
+        U[i].next[i] = x.next[i]
+    if x.next[0] is not None:
+        x.next[0].prev = x.prev
+    while L.level > 1 and L.head.next[L.level - 1] is None:
+        L.level -= 1
+    L.n -= 1
+    return x
+
+
+def skip_successor(L, k):
+    """Finds the node with the smallest key greater than a given key.
+
+    Complexity:
+        :math:`O(\\log n)` expected.
+
+    :param SkipList L: Skip list.
+    :param object k: A key, not necessarily present in the list.
+    :return: Successor node or :data:`None`.
+
+    """
+    x = find(L, k)[0].next[0]
+    if x is not None and x.key == k:
+        x = x.next[0]
+    return x
+
+
+def skip_predecessor(L, k):
+    """Finds the node with the largest key smaller than a given key.
+
+    Complexity:
+        :math:`O(\\log n)` expected.
+
+    :param SkipList L: Skip list.
+    :param object k: A key, not necessarily present in the list.
+    :return: Predecessor node or :data:`None`.
+
+    """
+    x = find(L, k)[0]
+    return None if x is L.head else x
+
+
+def skip_range(L, lo, hi):
+    """Iterates over the nodes with keys in a half-open range :math:`[lo, hi)`.
+
+    Complexity:
+        :math:`O(\\log n + m)` expected, where :math:`m` is the number of nodes in range.
+
+    :param SkipList L: Skip list.
+    :param object lo: Smallest key of the range.
+    :param object hi: Key after the end of the range.
+    :return: Generator of nodes in the order of their keys.
+
+    """
+    x = find(L, lo)[0].next[0]
+    while x is not None and x.key < hi:
+        yield x
+        x = x.next[0]
+
+
+def build_skip_list(K, V=None, p=0.5, max_level=32):
+    """Builds a skip list from keys in strictly increasing order.
+
+    Every new node is appended to the end of each of its levels, so no searches are
+    needed.
+
+    Complexity:
+        :math:`O(n)` expected.
+
+    :param K: Iterable of keys in strictly increasing order.
+    :param V: (optional) Iterable of values, :data:`None` for every key if omitted.
+    :param float p: (optional) Probability of promoting a node to the next level.
+    :param int max_level: (optional) Maximum number of levels.
+    :return: :data:`SkipList` instance.
+
+    """
+    L = SkipList(p, max_level)
+    U = [L.head] * max_level  # Last node on every level
+    y = None
+    for k, v in zip(K, repeat(None) if V is None else V):
+        if y is not None and not y.key < k:
+            raise ValueError("Keys are not in increasing order")
+        m = random_level(L)
+        z = Node(k, v, m)
+        for i in range(m):
+            U[i].next[i] = z
+            U[i] = z
+        z.prev = y
+        y = z
+        L.level = max(L.level, m)
+        L.n += 1
+    return L
@@ -0,0 +1,101 @@
+"""
+Heap-based Stream Processing
+============================
+
+Functions in :mod:`basic.heaps` operate on arrays that are held in memory entirely. Many
+problems on large data sets need only a small part of the data at a time, and a heap of a
+bounded size is enough to process a stream of any length.
+
+**Top-k selection** keeps the :math:`k` largest elements seen so far in a min-heap. The
+smallest of them is at the top of the heap, so every new element needs to be compared
+with the top only. If the new element is larger, it replaces the top, which then sinks to
+its place. To keep the :math:`k` smallest elements, a max-heap is used in the same way.
+
+**K-way merge** combines :math:`k` sorted sequences into one sorted sequence. A min-heap
+holds the current head of every sequence. The top of the heap is the next element of the
+output; it is replaced by the next element of the same sequence. This is the merge step
+of an external merge sort, where sorted runs do not fit in memory together.
+
+Heap entries are tuples of an element's key, a tie-breaking counter and the element
+itself. The counter makes both algorithms stable and ensures that the elements are never
+compared with each other, only their keys are.
+"""
+from basic.heaps import min_heapify, min_heap_insert, min_heap_extract
+from basic.heaps import max_heapify, max_heap_insert, max_heap_extract
+
+
+def top_k(S, k, key=None, largest=True):
+    """Selects :math:`k` largest (or smallest) elements of a stream.
+
+    Among elements with equal keys, those that appeared earlier are preferred.
+
+    Complexity:
+        :math:`O(n \\log k)` time and :math:`O(k)` space, where :math:`n` is the length of
+        the stream.
+
+    :param S: Iterable stream of elements.
+    :param int k: Number of elements to select.
+    :param (object)->object key: (optional) Function computing a comparison key of an
+     element.
+    :param bool largest: (optional) Select largest elements if :data:`True`, smallest
+     otherwise.
+    :return: List of selected elements, starting from the largest (or the smallest) one.
+
+    """
+    H = []
+    if k <= 0:
+        return H
+    for i, x in enumerate(S):
+        kx = x if key is None else key(x)
+        if largest:
+            e = (kx, -i, x)  # Later elements are smaller, so they get evicted first
+            if len(H) < k:
+                min_heap_insert(H, e)
+            elif e[:2] > H[0][:2]:
+                H[0] = e
+                min_heapify(H, 0)
+        else:
+            e = (kx, i, x)
+            if len(H) < k:
+                max_heap_insert(H, e)
+            elif e[:2] < H[0][:2]:
+                H[0] = e
+                max_heapify(H, 0)
+    L = []
+    while len(H) > 0:
+        L.append((min_heap_extract(H) if largest else max_heap_extract(H))[2])
+    L.reverse()
+    return L
+
+
+def k_way_merge(*iterables, key=None):
+    """Lazily merges sorted iterables into a single sorted stream.
+
+    Elements are consumed from the inputs only as the output advances. Among elements with
+    equal keys, those from the iterables listed first come out first.
+
+    Complexity:
+        :math:`O(n \\log k)` time and :math:`O(k)` space, where :math:`n` is the total
+        number of elements and :math:`k` is the number of iterables.
+
+    :param iterables: Iterables, each sorted in ascending order of keys.
+    :param (object)->object key: (optional) Function computing a comparison key of an
+     element.
+    :return: Next element of the merged stream.
+
+    """
+    H = []
+    for j, S in enumerate(iterables):
+        it = iter(S)
+        for x in it:  # Head of every non-empty iterable
+            min_heap_insert(H, (x if key is None else key(x), j, x, it))
+            break
+    while len(H) > 0:
+        kx, j, x, it = H[0]
+        yield x
+        for y in it:
+            H[0] = (y if key is None else key(y), j, y, it)  # Replace the top and sink it
+            min_heapify(H, 0)
+            break
+        else:
+            min_heap_extract(H)  # Iterable is exhausted
@@ -0,0 +1,62 @@
+"""
+Heap Benchmarks
+===============
+
+Measures push and pop throughput of d-ary min-heaps for several arities against the
+binary heap functions of :mod:`basic.heaps`. Run from the repository root::
+
+    python -m benchmarks.heaps [n]
+
+Push-heavy workloads favour wider heaps, since an inserted element climbs fewer levels.
+Pop-heavy workloads pay :math:`d` comparisons per level on the way down.
+"""
+import random
+import sys
+import time
+
+from basic.heaps import min_heap_insert, min_heap_extract
+from basic.d_ary_heaps import d_min_heap_insert, d_min_heap_extract
+
+
+def throughput(push, pop, keys):
+    """Measures push and pop throughput on a heap.
+
+    :param (list, object)->None push: Insert function.
+    :param (list)->object pop: Extract function.
+    :param list keys: Keys to push.
+    :return: Tuple of push and pop operations per second.
+
+    """
+    A = []
+    t0 = time.perf_counter()
+    for k in keys:
+        push(A, k)
+    t1 = time.perf_counter()
+    while A:
+        pop(A)
+    t2 = time.perf_counter()
+    n = len(keys)
+    return n / (t1 - t0), n / (t2 - t1)
+
+
+def run(n=200000, arities=(2, 4, 8)):
+    """Prints push/pop throughput for the binary heap and every d-ary heap.
+
+    :param int n: (optional) Number of keys.
+    :param tuple arities: (optional) Arities of d-ary heaps to compare.
+
+    """
+    keys = [random.random() for _ in range(n)]
+    print("%-12s %14s %14s" % ("heap", "push ops/s", "pop ops/s"))
+    rows = [("binary", min_heap_insert, min_heap_extract)]
+    for d in arities:
+        rows.append(("%d-ary" % d,
+                     lambda A, z, d=d: d_min_heap_insert(A, z, d),
+                     lambda A, d=d: d_min_heap_extract(A, d)))
+    for name, push, pop in rows:
+        p, q = throughput(push, pop, keys)
+        print("%-12s %14.0f %14.0f" % (name, p, q))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,100 @@
+"""
+Memory Benchmarks
+=================
+
+Measures the memory footprint of linked structures built from regular nodes, which keep
+their attributes in a per-instance dictionary, against the compact nodes, which declare
+them in ``__slots__``. Run from the repository root::
+
+    python -m benchmarks.memory [n]
+
+Every structure is filled with :math:`n` random keys, and the memory allocated while
+building it is traced with :mod:`tracemalloc`. Keys are created beforehand, so only the
+nodes and the containers are counted. Graphs are random, with an average out-degree of 4,
+and are measured per vertex, including its forward and reverse edges.
+"""
+import random
+import sys
+import tracemalloc
+
+import basic.linked_list as linked_list
+import trees.avl as avl
+import trees.bst as bst
+import trees.red_black as red_black
+from graphs import dict_to_graph
+
+
+def build_list(node, keys):
+    """Builds a linked list of nodes of a given class holding a list of keys.
+    """
+    L = linked_list.LinkedList()
+    for k in keys:
+        linked_list.list_insert(L, node(k))
+    return L
+
+
+def build_tree(tree, insert, node):
+    """Makes a builder of a search tree.
+
+    :param type tree: Tree class.
+    :param (BST, trees.bst.Node)->None insert: Tree insertion function.
+    :param type node: Node class.
+    :return: Function of a list of keys that returns a tree.
+
+    """
+    def run(keys):
+        T = tree()
+        for k in keys:
+            insert(T, node(k))
+        return T
+    return run
+
+
+STRUCTURES = (  # Name, builder with regular nodes, builder with compact nodes
+    ("linked list", lambda K: build_list(linked_list.Node, K),
+     lambda K: build_list(linked_list.CompactNode, K)),
+    ("bst", build_tree(bst.BST, bst.tree_insert, bst.Node),
+     build_tree(bst.BST, bst.tree_insert, bst.CompactNode)),
+    ("avl", build_tree(avl.AVLTree, avl.avl_insert, avl.Node),
+     build_tree(avl.AVLTree, avl.avl_insert, avl.CompactNode)),
+    ("red-black", build_tree(red_black.RedBlackTree, red_black.rb_insert, red_black.Node),
+     build_tree(red_black.RedBlackTree, red_black.rb_insert, red_black.CompactNode)),
+    ("graph", lambda D: dict_to_graph(D), lambda D: dict_to_graph(D, compact=True)),
+)
+
+
+def footprint(build, data):
+    """Measures the memory allocated by a builder.
+
+    :param (object)->object build: Function that builds a structure.
+    :param object data: Input of the builder.
+    :return: Number of bytes held by the built structure.
+
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    S = build(data)
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del S
+    return size
+
+
+def run(n=100000):
+    """Prints bytes per element of every structure with regular and compact nodes.
+
+    :param int n: (optional) Number of elements.
+
+    """
+    keys = random.sample(range(4 * n), n)
+    graph = {u: random.sample(range(n), 4) for u in range(n)}
+    print("%-12s %12s %12s %8s" % ("bytes/elem", "regular", "compact", "ratio"))
+    for name, regular, compact in STRUCTURES:
+        data = graph if name == "graph" else keys
+        r = footprint(regular, data) / n
+        c = footprint(compact, data) / n
+        print("%-12s %12.1f %12.1f %8.2f" % (name, r, c, r / c))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,56 @@
+"""
+Shortest Paths Benchmarks
+=========================
+
+Measures running time of :func:`dijkstra()` with every priority queue backend on random
+dense graphs. Run from the repository root::
+
+    python -m benchmarks.shortest_paths [n] [density]
+
+Dense graphs perform many more decrease-key operations than extractions, which is where
+pairing and Fibonacci heaps are expected to pay off.
+"""
+import random
+import sys
+import time
+
+from graphs import dict_to_graph
+from graphs.shortest_paths import dijkstra, PRIORITY_QUEUES
+
+
+def random_graph(n, p, w=100):
+    """Generates a random weighted directed graph.
+
+    :param int n: Number of vertices.
+    :param float p: Probability of an edge between any two vertices.
+    :param int w: (optional) Maximum integer edge weight.
+    :return: Dictionary representation of a graph, see :func:`dict_to_graph()`.
+
+    """
+    return {u: {v: random.randint(0, w) for v in range(n) if v != u and random.random() < p}
+            for u in range(n)}
+
+
+def run(n=500, p=0.5, backends=None):
+    """Prints running time of Dijkstra algorithm for every backend.
+
+    :param int n: (optional) Number of vertices.
+    :param float p: (optional) Edge density.
+    :param list backends: (optional) Names of backends to compare.
+
+    """
+    if backends is None:
+        backends = ["binary"] + list(PRIORITY_QUEUES)
+    D = random_graph(n, p)
+    print("%d vertices, %d edges" % (n, sum(len(D[u]) for u in D)))
+    print("%-12s %10s" % ("queue", "seconds"))
+    for q in backends:
+        G = dict_to_graph(D)
+        t0 = time.perf_counter()
+        dijkstra(G, G.map[0], q)
+        print("%-12s %10.3f" % (q, time.perf_counter() - t0))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.5)
@@ -0,0 +1,132 @@
+"""
+Skip List Benchmarks
+====================
+
+Measures the throughput of skip lists against the AVL and red-black trees of
+:mod:`trees` under mixed workloads of insertions, deletions and searches over random keys.
+Run from the repository root::
+
+    python -m benchmarks.skip_list [n]
+
+Every structure is filled with :math:`n` keys first, then runs the same sequence of
+:math:`n` operations. Trees reject duplicate keys, so a tree insertion is preceded by a
+search, which matches the insert-or-update semantics of :func:`skip_insert()`.
+"""
+import random
+import sys
+import time
+
+from basic.skip_list import SkipList, skip_insert, skip_delete, skip_search
+from trees.avl import AVLTree, Node as AVLNode, avl_insert, avl_delete
+from trees.bst import tree_search
+from trees.red_black import RedBlackTree, Node as RBNode, rb_insert, rb_delete
+
+WORKLOADS = (  # Name, share of insertions, share of deletions
+    ("read-heavy", 0.05, 0.0),
+    ("insert/search", 0.5, 0.0),
+    ("mixed", 0.2, 0.2),
+    ("write-heavy", 0.45, 0.45),
+)
+
+
+def tree_insert_new(insert, node):
+    """Makes an insert-if-absent function for a tree.
+
+    :param (BST, trees.bst.Node)->None insert: Tree insertion function.
+    :param (object)->trees.bst.Node node: Node constructor.
+    :return: Function of a tree and a key.
+
+    """
+    def run(T, k):
+        if tree_search(T.root, k) is None:
+            insert(T, node(k))
+    return run
+
+
+def tree_delete_key(delete):
+    """Makes a delete-by-key function for a tree.
+
+    :param (BST, trees.bst.Node)->None delete: Tree deletion function.
+    :return: Function of a tree and a key.
+
+    """
+    def run(T, k):
+        x = tree_search(T.root, k)
+        if x is not None:
+            delete(T, x)
+    return run
+
+
+STRUCTURES = (  # Name, constructor, insert, delete (None if unsupported), search
+    ("skip list p=1/2", lambda: SkipList(0.5), skip_insert, skip_delete, skip_search),
+    ("skip list p=1/4", lambda: SkipList(0.25), skip_insert, skip_delete, skip_search),
+    ("avl", AVLTree, tree_insert_new(avl_insert, AVLNode), tree_delete_key(avl_delete),
+     lambda T, k: tree_search(T.root, k)),
+    ("red-black", RedBlackTree, tree_insert_new(rb_insert, RBNode),
+     tree_delete_key(rb_delete), lambda T, k: tree_search(T.root, k)),
+)
+
+
+def operations(n, inserts, deletes, universe):
+    """Generates a random sequence of operations.
+
+    :param int n: Number of operations.
+    :param float inserts: Share of insertions.
+    :param float deletes: Share of deletions.
+    :param int universe: Keys are drawn from :math:`[0, universe)`.
+    :return: List of `(op, key)` tuples, where `op` is 0 to insert, 1 to delete and 2 to
+     search.
+
+    """
+    L = []
+    for _ in range(n):
+        r = random.random()
+        op = 0 if r < inserts else 1 if r < inserts + deletes else 2
+        L.append((op, random.randrange(universe)))
+    return L
+
+
+def throughput(make, insert, delete, search, keys, ops):
+    """Measures the throughput of a sequence of operations on a prefilled structure.
+
+    :param ()->object make: Constructor of an empty structure.
+    :param (object, object)->None insert: Insert function.
+    :param (object, object)->None delete: Delete function.
+    :param (object, object)->object search: Search function.
+    :param list keys: Keys to prefill the structure with.
+    :param list ops: Operations generated by :func:`operations()`.
+    :return: Operations per second.
+
+    """
+    T = make()
+    for k in keys:
+        insert(T, k)
+    f = (insert, delete, search)
+    t0 = time.perf_counter()
+    for op, k in ops:
+        f[op](T, k)
+    return len(ops) / (time.perf_counter() - t0)
+
+
+def run(n=100000):
+    """Prints the throughput of every structure under every workload.
+
+    :param int n: (optional) Number of prefilled keys and of measured operations.
+
+    """
+    universe = 4 * n
+    keys = random.sample(range(universe), n)
+    print("%-16s" % "ops/s" + "".join("%15s" % w[0] for w in WORKLOADS))
+    table = [operations(n, i, d, universe) for _, i, d in WORKLOADS]
+    for name, make, insert, delete, search in STRUCTURES:
+        row = "%-16s" % name
+        for (_, _, d), ops in zip(WORKLOADS, table):
+            if d > 0 and delete is None:
+                row += "%15s" % "-"
+            else:
+                row += "%15.0f" % throughput(make, insert, delete, search, keys, ops)
+        print(row)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -30,28 +30,56 @@ applications of DP go well beyond these examples and require substantial amount
 """
 from functools import wraps
 
+from tables.caches import LRUCache, LFUCache
 
-def memoize(f):
+
+def memoize(f=None, maxsize=None, policy="lru"):
     """Memoization function decorator.
 
     Loads value from cache if a solution for given function arguments was already computed.
+    The cache is an unbounded dictionary by default. If the maximum size is given, a bounded
+    cache of :mod:`tables.caches` is used instead, which is available as the ``cache``
+    attribute of the decorated function. Can be applied both as ``@memoize`` and as
+    ``@memoize(maxsize=1024, policy="lfu")``.
 
     Complexity:
         `O(1)` for storage and retrieval.
 
     :param (tuple)->(Any) f: Function.
+    :param int maxsize: (optional) Maximum number of cached solutions.
+    :param str policy: (optional) Eviction policy of a bounded cache, ``"lru"`` or
+     ``"lfu"``.
     :return: Return value of a function.
 
     """
-    cache = {}
+    if policy not in ("lru", "lfu"):
+        raise ValueError("Unknown cache policy")
+    if f is None:
+        return lambda g: memoize(g, maxsize, policy)
+    if maxsize is None:
+        cache = {}
 
-    @wraps(f)
-    def run(*args):
-        if args not in cache:
-            cache[args] = f(*args)
-        return cache[args]
+        @wraps(f)
+        def run(*args):
+            if args not in cache:
+                cache[args] = f(*args)
+            return cache[args]
+
+        return run
 
-    return run
+    bounded = LRUCache(maxsize) if policy == "lru" else LFUCache(maxsize)
+    missing = object()
+
+    @wraps(f)
+    def run_bounded(*args):
+        x = bounded.get(args, missing)
+        if x is missing:
+            x = f(*args)
+            bounded.put(args, x)
+        return x
+
+    run_bounded.cache = bounded
+    return run_bounded
 
 
 @memoize
@@ -20,6 +20,10 @@ and **adjacency matrix** (2D array).
 Adjacency list can be used to represent both directed and **undirected graph** types. For
 an undirected graph, relation between adjacent vertices is always mutual, while in a
 directed graph, it is not necessarily the case.
+
+Large graphs can be built from **compact** vertices and edges, which declare their
+attributes in ``__slots__`` and have no per-instance attribute dictionary. They behave
+like regular vertices and edges in every algorithm, but take much less memory.
 """
 
 
@@ -31,6 +35,12 @@ class Graph:
     map = {}  # Map of vertices, keyed by their key
     V = []  # List of pointers to all vertices
 
+    def __init__(self):
+        """Basic adjacency list graph representation.
+        """
+        self.map = {}
+        self.V = []
+
     def Adj(self, v):
         """Iterates through adjacent vertices of a vertex.
 
@@ -77,6 +87,24 @@ class Edge:
         self.weight = w
 
 
+class CompactEdge:
+    """Edge of a graph with attributes stored in slots.
+    """
+    __slots__ = ("u", "v", "weight")
+
+    def __init__(self, u, v, w=None):
+        """Edge of a graph with attributes stored in slots.
+
+        :param Vertex u: Source vertex.
+        :param Vertex v: Target vertex.
+        :param float w: (optional) Weight of an edge.
+
+        """
+        self.u = u
+        self.v = v
+        self.weight = w
+
+
 def degree(v):
     """Returns degree of a vertex.
 
@@ -152,6 +180,8 @@ class Vertex:
 
         """
         self.key = k
+        self.f_edges = {}
+        self.r_edges = {}
 
     """
     Vertex comparison operators based on `d` value (used in Dijkstra edge prioritization)
@@ -176,7 +206,37 @@ class Vertex:
         return str(self.key)
 
 
-def dict_to_graph(D):
+class CompactVertex:
+    """Graph node with attributes stored in slots.
+
+    Has the same attributes and comparison operators as :class:`Vertex`.
+    """
+    __slots__ = ("d", "f", "color", "p", "pt", "key", "f_edges", "r_edges")
+
+    def __init__(self, k):
+        """Graph node with attributes stored in slots.
+
+        :param object k: Key held by a vertex
+
+        """
+        self.d = None
+        self.f = None
+        self.color = None
+        self.p = None
+        self.pt = 0.0
+        self.key = k
+        self.f_edges = {}
+        self.r_edges = {}
+
+    __lt__ = Vertex.__lt__
+    __le__ = Vertex.__le__
+    __gt__ = Vertex.__gt__
+    __ge__ = Vertex.__ge__
+    __eq__ = Vertex.__eq__
+    __str__ = Vertex.__str__
+
+
+def dict_to_graph(D, compact=False):
     """Converts dictionary into a graph.
 
     Utility function. Assumed dictionary representation is in following format:
@@ -187,12 +247,15 @@ def dict_to_graph(D):
     preservation, which may lead to random results in certain algorithms, such as DFS.
 
     :param dict D: Input dictionary.
+    :param bool compact: (optional) Build the graph from :class:`CompactVertex` and
+     :class:`CompactEdge` objects.
     :return: Output :data:`Graph` object.
 
     """
     G = Graph()
+    vertex, edge = (CompactVertex, CompactEdge) if compact else (Vertex, Edge)
     for i in D:  # Creating pointers for all vertices
-        v = Vertex(i)
+        v = vertex(i)
         G.map[v.key] = v
         G.V.append(v)
     for i in D:  # Creating edges
@@ -203,8 +266,8 @@ def dict_to_graph(D):
             else:
                 w = None
             v = G.map[j]
-            u.f_edges[j] = Edge(u, v, w)
-            v.r_edges[i] = Edge(v, u, w)
+            u.f_edges[j] = edge(u, v, w)
+            v.r_edges[i] = edge(v, u, w)
     return G
 
 
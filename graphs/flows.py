@@ -0,0 +1,390 @@
+"""
+Maximum Flow
+============
+
+A **flow network** is a directed graph in which every edge :math:`(u, v)` has a
+non-negative **capacity** :math:`c(u, v)`. Two vertices are distinguished: a **source**
+:math:`s` and a **sink** :math:`t`. A flow is an assignment of values to the edges that
+never exceeds the capacity of an edge and, for every vertex other than :math:`s` and
+:math:`t`, keeps the amount of incoming flow equal to the outgoing flow (*flow
+conservation*). The maximum-flow problem asks for the largest amount of flow that can be
+sent from the source to the sink.
+
+Given a flow, the **residual network** consists of the edges that can admit more flow.
+Every edge :math:`(u, v)` carrying flow :math:`f` has a residual capacity
+:math:`c(u, v) - f` and a paired reverse edge :math:`(v, u)` with residual capacity
+:math:`f` through which the flow can be "cancelled". Reverse edges play the same role as
+the reverse links kept in :data:`Vertex.r_edges`. An **augmenting path** is a simple path
+from :math:`s` to :math:`t` in the residual network.
+
+A **cut** :math:`(S, T)` partitions the vertices so that :math:`s \\in S` and :math:`t \\in
+T`. The *max-flow min-cut theorem* states that the value of a maximum flow equals the
+capacity of a minimum cut. Once the maximum flow is found, :math:`S` is simply the set of
+vertices reachable from the source in the residual network.
+
+Linked :data:`Vertex` and :data:`Edge` objects are convenient, but they are slow to
+traverse and expensive to store for graphs with millions of edges. Algorithms in this
+module operate on a :data:`FlowNetwork`, which keeps the residual network in flat arrays
+indexed by integers (so called *forward star* representation). Arcs are stored in pairs:
+arc :math:`e` and its reverse arc :math:`e \\oplus 1`, so the reverse of any arc is found
+with a single bitwise operation.
+"""
+from graphs import Graph, Vertex
+
+
+class FlowNetwork:
+    """Array-based residual network.
+
+    Vertices are numbered :math:`0..n-1`. Each arc :math:`e` has a head vertex
+    :math:`to[e]`, a residual capacity :math:`cap[e]`, an original capacity :math:`c[e]`
+    and an index :math:`nxt[e]` of the next arc leaving the same vertex. :math:`first[u]`
+    holds the index of the first arc leaving vertex :math:`u` or :math:`-1`.
+    """
+    n = 0  # Number of vertices
+    first = []  # First arc leaving a vertex
+    nxt = []  # Next arc leaving the same vertex
+    to = []  # Head vertex of an arc
+    cap = []  # Residual capacity of an arc
+    c = []  # Original capacity of an arc
+    keys = []  # Vertex keys by index
+    index = {}  # Vertex indices by key
+
+    def __init__(self, n):
+        """Array-based residual network.
+
+        :param int n: Number of vertices.
+
+        """
+        self.n = n
+        self.first = [-1] * n
+        self.nxt = []
+        self.to = []
+        self.cap = []
+        self.c = []
+        self.keys = list(range(n))
+        self.index = {}
+
+
+def add_edge(N, u, v, c, r=0):
+    """Adds a pair of arcs to a flow network.
+
+    The forward arc :math:`(u, v)` is given capacity :math:`c` and the reverse arc
+    :math:`(v, u)` is given capacity :math:`r`, which is :math:`0` unless the graph has an
+    edge in the opposite direction. Sharing a single pair of arcs between two anti-parallel
+    edges halves the size of the residual network.
+
+    Complexity:
+        :math:`O(1)` amortized.
+
+    :param FlowNetwork N: Flow network.
+    :param int u: Tail vertex index.
+    :param int v: Head vertex index.
+    :param float c: Capacity of the forward arc.
+    :param float r: (optional) Capacity of the reverse arc.
+    :return: Index of the forward arc.
+
+    """
+    e = len(N.to)
+    N.to.append(v)
+    N.cap.append(c)
+    N.c.append(c)
+    N.nxt.append(N.first[u])
+    N.first[u] = e
+    N.to.append(u)
+    N.cap.append(r)
+    N.c.append(r)
+    N.nxt.append(N.first[v])
+    N.first[v] = e + 1
+    return e
+
+
+def graph_to_network(G):
+    """Converts a weighted graph into a flow network.
+
+    Edge weights are used as capacities. Reverse links in :data:`Vertex.r_edges` are used
+    to detect anti-parallel edges :math:`(u, v)` and :math:`(v, u)`; such edges share a
+    single pair of arcs instead of two.
+
+    Complexity:
+        :math:`O(V+E)`.
+
+    :param Graph G: Weighted directed graph.
+    :return: :data:`FlowNetwork` with vertex keys preserved in :math:`N.keys`.
+
+    """
+    N = FlowNetwork(len(G.V))
+    for i, v in enumerate(G.V):
+        N.keys[i] = v.key
+        N.index[v.key] = i
+    for u in G.V:
+        i = N.index[u.key]
+        for k in u.f_edges:
+            j = N.index[k]
+            c = u.f_edges[k].weight
+            if k in u.r_edges:  # Anti-parallel edge `(v, u)` exists
+                if i < j:  # Add the pair only once
+                    add_edge(N, i, j, c, u.r_edges[k].weight)
+                elif i == j:
+                    pass  # Self-loops never carry useful flow
+            else:
+                add_edge(N, i, j, c)
+    return N
+
+
+def bfs_levels(N, s, t):
+    """Computes the level graph of a residual network.
+
+    Level of a vertex is its distance (in arcs) from the source in the residual network.
+    Only arcs leading from level :math:`i` to level :math:`i+1` belong to the level graph.
+
+    Complexity:
+        :math:`O(V+E)`.
+
+    :param FlowNetwork N: Flow network.
+    :param int s: Source vertex index.
+    :param int t: Sink vertex index.
+    :return: List of levels (:math:`-1` for unreachable vertices) or :data:`None` if the
+     sink is not reachable.
+
+    """
+    first, nxt, to, cap = N.first, N.nxt, N.to, N.cap
+    level = [-1] * N.n
+    level[s] = 0
+    Q = [s]  # Frontier is consumed in order, so a plain list serves as a queue
+    for u in Q:
+        d = level[u] + 1
+        e = first[u]
+        while e != -1:
+            v = to[e]
+            if cap[e] > 0 and level[v] < 0:
+                level[v] = d
+                Q.append(v)
+            e = nxt[e]
+    if level[t] < 0:
+        return None
+    return level
+
+
+def blocking_flow(N, s, t, level):
+    """Finds a blocking flow in the level graph.
+
+    A flow is *blocking* if every path from the source to the sink in the level graph
+    contains a saturated arc. The search is an iterative DFS that keeps a pointer to the
+    current arc of every vertex. Arcs that led to a dead end or got saturated are never
+    scanned again during the phase.
+
+    Complexity:
+        :math:`O(VE)`.
+
+    :param FlowNetwork N: Flow network.
+    :param int s: Source vertex index.
+    :param int t: Sink vertex index.
+    :param list[int] level: Level graph computed by :func:`bfs_levels()`.
+    :return: Value of the blocking flow.
+
+    """
+    nxt, to, cap = N.nxt, N.to, N.cap
+    it = list(N.first)  # Current arc of every vertex
+    f = 0
+    path = []  # Arcs of the current path from the source
+    u = s
+    while True:
+        if u == t:  # Augment along the path
+            b = min(cap[e] for e in path)  # Bottleneck capacity
+            k = -1
+            for i, e in enumerate(path):
+                cap[e] -= b
+                cap[e ^ 1] += b
+                if k < 0 and cap[e] <= 0:
+                    k = i  # First saturated arc
+            f += b
+            del path[k:]  # Retreat to the tail of the first saturated arc
+            u = to[path[-1]] if path else s
+            continue
+        e = it[u]
+        while e != -1 and (cap[e] <= 0 or level[to[e]] != level[u] + 1):
+            e = nxt[e]
+        it[u] = e
+        if e != -1:  # Advance
+            path.append(e)
+            u = to[e]
+        elif u == s:
+            break
+        else:  # Dead end, retreat and skip the arc that led here
+            e = path.pop()
+            u = to[e ^ 1]
+            it[u] = nxt[it[u]]
+    return f
+
+
+def dinic(N, s, t):
+    """Dinic maximum-flow algorithm.
+
+    Dinic algorithm works in phases. Each phase builds a level graph by a BFS from the
+    source, then saturates it with a blocking flow. Distance from the source to the sink
+    in the residual network strictly increases after every phase, so there are at most
+    :math:`V` phases. On unit-capacity networks the algorithm runs in
+    :math:`O(E \\sqrt V)` time.
+
+    The residual capacities of :math:`N` are updated in place, so :func:`min_cut()` can
+    be called afterwards.
+
+    Complexity:
+        :math:`O(V^2 E)`.
+
+    :param FlowNetwork N: Flow network.
+    :param int s: Source vertex index.
+    :param int t: Sink vertex index.
+    :return: Value of the maximum flow.
+
+    """
+    if s == t:
+        raise ValueError("Source and sink must differ")
+    f = 0
+    level = bfs_levels(N, s, t)
+    while level is not None:
+        f += blocking_flow(N, s, t, level)
+        level = bfs_levels(N, s, t)
+    return f
+
+
+def push_relabel(N, s, t):
+    """Push-relabel maximum-flow algorithm with FIFO vertex selection.
+
+    Instead of augmenting paths, push-relabel maintains a *preflow*, in which a vertex may
+    temporarily hold more incoming than outgoing flow (an *excess*). Every vertex is given
+    a height. Excess is pushed along residual arcs "downhill" to neighbours exactly one
+    level lower; a vertex that cannot push is *relabeled* (lifted) just above its lowest
+    residual neighbour. Excess that cannot reach the sink eventually flows back to the
+    source.
+
+    Active vertices are processed in FIFO order. The *gap heuristic* lifts every vertex
+    above a height that no longer has any vertices to :math:`V+1` at once, since the sink
+    is no longer reachable from them. Push-relabel tends to outperform Dinic on dense
+    networks.
+
+    Complexity:
+        :math:`O(V^3)`.
+
+    :param FlowNetwork N: Flow network.
+    :param int s: Source vertex index.
+    :param int t: Sink vertex index.
+    :return: Value of the maximum flow.
+
+    """
+    if s == t:
+        raise ValueError("Source and sink must differ")
+    n = N.n
+    first, nxt, to, cap = N.first, N.nxt, N.to, N.cap
+    h = [0] * n  # Heights
+    x = [0] * n  # Excess
+    count = [0] * (2 * n + 2)  # Number of vertices at every height
+    it = list(first)  # Current arc of every vertex
+    h[s] = n
+    count[0] = n - 1
+    count[n] = 1
+    Q = []  # FIFO of active vertices
+    q = 0  # Index of the head of the FIFO
+    e = first[s]
+    while e != -1:  # Saturate all arcs leaving the source
+        v = to[e]
+        b = cap[e]
+        if b > 0:
+            cap[e] = 0
+            cap[e ^ 1] += b
+            x[v] += b
+            x[s] -= b
+            if v != t and x[v] == b:
+                Q.append(v)
+        e = nxt[e]
+    while q < len(Q):
+        u = Q[q]
+        q += 1
+        while x[u] > 0:  # Discharge `u`
+            e = it[u]
+            if e == -1:  # Relabel
+                m = 2 * n
+                e = first[u]
+                while e != -1:
+                    if cap[e] > 0 and h[to[e]] < m:
+                        m = h[to[e]]
+                    e = nxt[e]
+                g = h[u]
+                count[g] -= 1
+                h[u] = m + 1
+                count[h[u]] += 1
+                it[u] = first[u]
+                if count[g] == 0 and g < n:  # Gap heuristic
+                    for v in range(n):
+                        if g < h[v] < n:
+                            count[h[v]] -= 1
+                            h[v] = n + 1
+                            count[n + 1] += 1
+                continue
+            v = to[e]
+            if cap[e] > 0 and h[u] == h[v] + 1:  # Push
+                b = min(x[u], cap[e])
+                cap[e] -= b
+                cap[e ^ 1] += b
+                x[u] -= b
+                x[v] += b
+                if v != s and v != t and x[v] == b:
+                    Q.append(v)  # `v` became active
+            else:
+                it[u] = nxt[e]
+    return x[t]
+
+
+def min_cut(N, s):
+    """Finds a minimum cut from residual capacities left by a maximum-flow algorithm.
+
+    Complexity:
+        :math:`O(V+E)`.
+
+    :param FlowNetwork N: Flow network after :func:`dinic()` or :func:`push_relabel()`.
+    :param int s: Source vertex index.
+    :return: Tuple of the source side :math:`S` as a list of vertex keys and the list of
+     cut edges as tuples of vertex keys.
+
+    """
+    first, nxt, to, cap, c = N.first, N.nxt, N.to, N.cap, N.c
+    seen = [False] * N.n
+    seen[s] = True
+    Q = [s]
+    for u in Q:
+        e = first[u]
+        while e != -1:
+            v = to[e]
+            if cap[e] > 0 and not seen[v]:
+                seen[v] = True
+                Q.append(v)
+            e = nxt[e]
+    cut = []
+    for u in Q:
+        e = first[u]
+        while e != -1:
+            if c[e] > 0 and not seen[to[e]]:
+                cut.append((N.keys[u], N.keys[to[e]]))
+            e = nxt[e]
+    return [N.keys[u] for u in Q], cut
+
+
+def max_flow_min_cut(G, s, t, algorithm=dinic):
+    """Solves maximum-flow and minimum-cut problems on a weighted graph.
+
+    Complexity:
+        Depends on the algorithm, :math:`O(V^2 E)` for :func:`dinic()`.
+
+    :param Graph G: Weighted directed graph, weights are treated as capacities.
+    :param Vertex s: Source vertex.
+    :param Vertex t: Sink vertex.
+    :param algorithm: (optional) :func:`dinic()` or :func:`push_relabel()`.
+    :return: Tuple of the maximum flow value, the source side of a minimum cut and the list
+     of cut edges, see :func:`min_cut()`.
+
+    """
+    N = graph_to_network(G)
+    i = N.index[s.key]
+    f = algorithm(N, i, N.index[t.key])
+    S, cut = min_cut(N, i)
+    return f, S, cut
@@ -0,0 +1,238 @@
+"""
+Shortest Path Query Server
+==========================
+
+A shortest-paths tree computed by :func:`dijkstra()` answers the question "how far is
+:math:`v` from :math:`s`" for *every* vertex :math:`v` at once. When many clients ask for
+paths from the same few sources, running the search once per query wastes most of the
+work. **Request batching** groups queries that arrive within a short time window by their
+source vertex, so a single run of the algorithm answers all targets of the group.
+
+The server below loads a graph once and serves queries over a Unix domain socket or a
+localhost TCP port using :mod:`asyncio`. The protocol is line based. A request is a line of
+two vertex keys separated by a space, ``<source> <target>``. A response is a line with the
+path weight followed by the keys of the vertices on the shortest path, or ``inf`` if the
+target is unreachable::
+
+    > A D
+    < 4.5 A C D
+    > A X
+    < inf
+    > STATS
+    < queries=2 runs=1 errors=0 mean_latency_ms=2.114 max_latency_ms=2.301 qps=0.8
+
+Unknown vertices, and queries whose search has failed, produce an ``error`` line. Since
+vertices hold shortest-path estimates as their attributes, searches are never run
+concurrently: all of them happen on the event loop thread, one batch at a time.
+"""
+import asyncio
+import time
+
+from graphs import Graph, Vertex
+from graphs.shortest_paths import dijkstra, inf
+
+
+def path_keys(s, t):
+    """Lists the keys of the vertices on a shortest path found by a search from :math:`s`.
+
+    The path is followed iteratively through the parent pointers, so it may be of any
+    length.
+
+    Complexity:
+        :math:`O(V)`.
+
+    :param Vertex s: Source vertex of the search.
+    :param Vertex t: Target vertex reachable from :math:`s`.
+    :return: List of vertex keys from :math:`s` to :math:`t`.
+
+    """
+    L = [t.key]
+    while t is not s:
+        t = t.p
+        L.append(t.key)
+    L.reverse()
+    return L
+
+
+class QueryServer:
+    """Shortest path query server with per-source request batching.
+
+    Counters are kept for the number of answered queries, the number of searches, the
+    number of malformed or failed requests and the sum and maximum of query latencies.
+    """
+    G = None
+    window = 0.0  # Batching window in seconds
+    queue = "indexed"  # Priority queue backend of searches
+    vertices = {}  # Vertices by string representation of their keys
+    pending = {}  # Waiting queries, lists of `(target, future)` keyed by source
+    queries = 0
+    runs = 0
+    errors = 0
+    latency = 0.0  # Total latency of answered queries
+    max_latency = 0.0
+    started = 0.0
+
+    def __init__(self, G, window=0.002, queue="indexed"):
+        """Shortest path query server with per-source request batching.
+
+        :param Graph G: Weighted directed graph with non-negative weights.
+        :param float window: (optional) Time in seconds to wait for more queries with the
+         same source before running a search.
+        :param str queue: (optional) Priority queue backend of :func:`dijkstra()`, a key of
+         :data:`graphs.shortest_paths.PRIORITY_QUEUES`. A decrease-key backend is used by
+         default, the ``"binary"`` backend rebuilds its heap after every extraction.
+
+        """
+        self.G = G
+        self.window = window
+        self.queue = queue
+        self.vertices = {str(v.key): v for v in G.V}
+        self.pending = {}
+        self.started = time.monotonic()
+
+    async def query(self, s, t):
+        """Answers a single shortest path query.
+
+        The query is put on hold until the batching window of its source closes.
+
+        :param str s: Key of the source vertex.
+        :param str t: Key of the target vertex.
+        :return: Tuple of the path weight and the list of keys on the path (empty if the
+         target is unreachable).
+
+        """
+        s = self.vertices[s]
+        t = self.vertices[t]
+        f = asyncio.get_running_loop().create_future()
+        if s.key not in self.pending:
+            self.pending[s.key] = []
+            asyncio.get_running_loop().call_later(self.window, self.flush, s)
+        self.pending[s.key].append((t, f))
+        return await f
+
+    def flush(self, s):
+        """Runs a single search for a batch of queries with a common source.
+
+        Complexity:
+            Cost of :func:`dijkstra()` plus :math:`O(V)` per path.
+
+        :param Vertex s: Source vertex.
+
+        """
+        batch = self.pending.pop(s.key)
+        try:
+            dijkstra(self.G, s, self.queue)
+            self.runs += 1
+            for t, f in batch:
+                if f.done():  # Client has gone away
+                    continue
+                if t.d == inf:
+                    f.set_result((inf, []))
+                else:
+                    f.set_result((t.d, path_keys(s, t)))
+        except Exception as e:  # Queries of the batch must not be left waiting
+            for _, f in batch:
+                if not f.done():
+                    f.set_exception(e)
+
+    def stats(self):
+        """Returns a line of server counters.
+
+        :return: Space separated list of counters.
+
+        """
+        n = self.queries
+        elapsed = time.monotonic() - self.started
+        return "queries=%d runs=%d errors=%d mean_latency_ms=%.3f " \
+               "max_latency_ms=%.3f qps=%.1f" % (
+                   n, self.runs, self.errors, 1000 * self.latency / n if n else 0.0,
+                   1000 * self.max_latency, n / elapsed if elapsed > 0 else 0.0)
+
+    async def handle(self, reader, writer):
+        """Serves a single client connection.
+
+        Requests of a connection are answered concurrently, but responses are written in
+        the order of requests.
+
+        :param asyncio.StreamReader reader: Client input stream.
+        :param asyncio.StreamWriter writer: Client output stream.
+
+        """
+        replies = asyncio.Queue()  # Response futures in order of requests
+
+        async def respond():
+            while True:
+                r = await replies.get()
+                if r is None:
+                    break
+                writer.write((await r + "\n").encode())
+                try:
+                    await writer.drain()
+                except ConnectionError:  # Client has disconnected
+                    break
+
+        writer_task = asyncio.ensure_future(respond())
+        try:
+            async for line in reader:
+                replies.put_nowait(asyncio.ensure_future(self.answer(line.decode())))
+        finally:
+            replies.put_nowait(None)
+            await writer_task
+            writer.close()
+
+    async def answer(self, line):
+        """Produces a response line for a request line.
+
+        :param str line: Request line.
+        :return: Response line without the line terminator.
+
+        """
+        args = line.split()
+        if args == ["STATS"]:
+            return self.stats()
+        if len(args) != 2 or args[0] not in self.vertices or args[1] not in self.vertices:
+            self.errors += 1
+            return "error"
+        t0 = time.monotonic()
+        try:
+            d, path = await self.query(args[0], args[1])
+        except Exception:
+            self.errors += 1
+            return "error"
+        dt = time.monotonic() - t0
+        self.queries += 1
+        self.latency += dt
+        self.max_latency = max(self.max_latency, dt)
+        return " ".join([str(d)] + [str(k) for k in path])
+
+    async def start(self, path=None, host="127.0.0.1", port=7878):
+        """Starts listening on a Unix domain socket or on a TCP port.
+
+        :param str path: (optional) Unix socket path. TCP is used if omitted.
+        :param str host: (optional) Interface to bind to, localhost by default.
+        :param int port: (optional) TCP port.
+        :return: :class:`asyncio.AbstractServer` instance.
+
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path=path)
+        return await asyncio.start_server(self.handle, host=host, port=port)
+
+
+def serve(G, path=None, host="127.0.0.1", port=7878, window=0.002, queue="indexed"):
+    """Loads a graph into a query server and serves requests until interrupted.
+
+    :param Graph G: Weighted directed graph with non-negative weights.
+    :param str path: (optional) Unix socket path. TCP is used if omitted.
+    :param str host: (optional) Interface to bind to, localhost by default.
+    :param int port: (optional) TCP port.
+    :param float window: (optional) Batching window in seconds.
+    :param str queue: (optional) Priority queue backend of searches.
+
+    """
+    async def run():
+        server = await QueryServer(G, window, queue).start(path, host, port)
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(run())
@@ -2,7 +2,7 @@
 Graph Search Algorithms
 =======================
 """
-from basic.fifo import Queue, enqueue, dequeue
+from basic.ring_buffer import RingBuffer, enqueue, dequeue
 from graphs import Graph, Vertex, Counter
 
 
@@ -27,6 +27,9 @@ def bfs(G, s):
     computes **the shortest path**, or a minimum amount of edges it took to reach the
     vertex from a starting vertex in an unweighted graph.
 
+    The frontier is kept in a growable ring buffer, so the memory used by the queue is
+    proportional to the size of the frontier rather than to the number of vertices.
+
     Complexity:
         :math:`O(V+E)`. :math:`V` devoted to queue operations for each vertex and
         :math:`E` time is spent on scanning adjacent vertices.
@@ -35,7 +38,6 @@ def bfs(G, s):
     :param Vertex s: The starting vertex.
 
     """
-    n = len(G.V)  # Total number of vertices in a graph
     # Initialize graph for the search
     for u in G.V:
         if u is not s:
@@ -45,7 +47,7 @@ def bfs(G, s):
     s.color = GRAY
     s.d = 0  # mark starting distance
     s.p = None
-    Q = Queue(n)
+    Q = RingBuffer()
     enqueue(Q, s)
     while Q.length != 0:
         u = dequeue(Q)
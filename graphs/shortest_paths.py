@@ -25,7 +25,16 @@ Algorithms in this module cover solutions to a **single-source shortest paths**
 They share the steps of initialization, edge relaxation and shortest-path estimation.
 Other powerful method worth mentioning is a *bidirectional search*.
 """
-from basic.heaps import build_min_heap, min_heap_extract
+from basic.heaps import build_min_heap, min_heap_extract, PriorityQueue
+from basic.pairing_heap import PairingHeap, Node as PairingNode
+from basic.pairing_heap import pairing_heap_insert, pairing_heap_extract_min
+from basic.pairing_heap import pairing_heap_decrease_key
+from basic.fibonacci_heap import FibonacciHeap, Node as FibNode
+from basic.fibonacci_heap import fib_heap_insert, fib_heap_extract_min
+from basic.fibonacci_heap import fib_heap_decrease_key
+from basic.radix_heap import RadixHeap, Node as RadixNode
+from basic.radix_heap import radix_heap_insert, radix_heap_extract_min
+from basic.radix_heap import radix_heap_decrease_key
 from graphs import Graph, Vertex, weight
 from graphs.topological_sort import topological_sort
 
@@ -93,7 +102,7 @@ def bellman_ford(G, s):
     return True
 
 
-def dijkstra(G, s):
+def dijkstra(G, s, queue="binary"):
     """Dijkstra single-source shortest-paths algorithm.
 
     In contrast to Bellman-Ford, Dijkstra's algorithm uses greedy strategy on solving the
@@ -109,7 +118,10 @@ def dijkstra(G, s):
     We only need to stop the loop once the target vertex is found.
 
     This implementation uses a priority queue (min-heap) to sort the vertices by their
-    :math:`d` values.
+    :math:`d` values. By default, the heap is simply rebuilt from the list of vertices
+    after every extraction. Other backends from :data:`PRIORITY_QUEUES` keep a handle to
+    every queued vertex and update its position with a decrease-key operation when an edge
+    into the vertex is relaxed. A vertex is queued only once its estimate becomes finite.
 
     Complexity:
         :math:`O(E \log V)`. There are at most :math:`|\\textrm{reachable } E|` relax
@@ -119,9 +131,14 @@ def dijkstra(G, s):
 
     :param Graph G: Weighted directed graph with non-negative weights.
     :param Vertex s: Starting vertex.
+    :param str queue: (optional) Priority queue backend: ``"binary"`` or one of the keys of
+     :data:`PRIORITY_QUEUES`. The ``"radix"`` backend requires integer edge weights.
 
     """
     initialize_single_source(G, s)
+    if queue != "binary":
+        dijkstra_decrease_key(G, s, *PRIORITY_QUEUES[queue])
+        return
     S = []  # Set of vertices whose final shortest-path weights have been determined
     Q = G.V
     while len(Q) > 0:
@@ -138,6 +155,77 @@ Constants and subroutines used in shortest paths algorithms
 """
 inf = float("inf")
 
+"""
+Priority queue backends for Dijkstra algorithm. Every backend is a tuple of functions
+`(make, insert, extract_min, decrease_key)`. `insert(Q, x, k)` returns a handle that is
+later passed to `decrease_key(Q, h, k)`; `extract_min(Q)` returns the vertex itself.
+"""
+PRIORITY_QUEUES = {
+    "indexed": (PriorityQueue,
+                PriorityQueue.push,
+                PriorityQueue.pop,
+                PriorityQueue.decrease_key),
+    "pairing": (PairingHeap,
+                lambda Q, x, k: pairing_heap_insert(Q, PairingNode(k, x)),
+                lambda Q: pairing_heap_extract_min(Q).item,
+                pairing_heap_decrease_key),
+    "fibonacci": (FibonacciHeap,
+                  lambda Q, x, k: fib_heap_insert(Q, FibNode(k, x)),
+                  lambda Q: fib_heap_extract_min(Q).item,
+                  fib_heap_decrease_key),
+    "radix": (RadixHeap,
+              lambda Q, x, k: radix_heap_insert(Q, RadixNode(integer_key(k), x)),
+              lambda Q: radix_heap_extract_min(Q).item,
+              lambda Q, h, k: radix_heap_decrease_key(Q, h, integer_key(k))),
+}
+
+
+def integer_key(k):
+    """Converts a path weight estimate into an integer priority key.
+
+    Estimates are accumulated from edge weights and vertex potentials, which may turn
+    integer weights into floating point numbers with integral values.
+
+    :param k: Path weight estimate.
+    :return int: Integer key.
+
+    """
+    if k != int(k):
+        raise ValueError("Radix heap requires integer weights")
+    return int(k)
+
+
+def dijkstra_decrease_key(G, s, make, insert, extract_min, decrease_key):
+    """Main loop of Dijkstra algorithm over a priority queue with decrease-key.
+
+    Complexity:
+        :math:`O(V)` insert and extract-min operations and :math:`O(E)` decrease-key
+        operations.
+
+    :param Graph G: Weighted directed graph with initialized estimates.
+    :param Vertex s: Starting vertex.
+    :param make: Priority queue constructor.
+    :param insert: Insert function, returns a handle.
+    :param extract_min: Extract-min function.
+    :param decrease_key: Decrease-key function.
+
+    """
+    S = []
+    Q = make()
+    H = {s.key: insert(Q, s, s.d)}  # Handles of queued vertices by vertex key
+    while len(Q) > 0:
+        u = extract_min(Q)
+        S.append(u)
+        for v in G.Adj(u):
+            d = v.d
+            relax(u, v)
+            if v.d < d:
+                if v.key in H:
+                    decrease_key(Q, H[v.key], v.d)
+                else:
+                    H[v.key] = insert(Q, v, v.d)
+    G.V = S + [v for v in G.V if v.key not in H]  # Unreachable vertices go last
+
 
 def path_string(G, s, v):
     """Prints out the shortest path between two vertices in a graph.
@@ -3,6 +3,7 @@ Comparison Sorting Algorithms
 =============================
 """
 from basic.heaps import build_max_heap, max_heapify
+from basic.d_ary_heaps import build_d_max_heap, d_max_heapify
 
 
 def bubble_sort(A):
@@ -51,7 +52,29 @@ def heap_sort(A):
         # Stash top element at the end of the array, replace top element with
         # the one at the bottom of the heap.
         A[0], A[i] = A[i], A[0]
-        max_heapify(A, 0)  # Let top element sink down to its place in the heap
+        max_heapify(A, 0, i)  # Let top element sink down to its place in the heap
+
+
+def d_ary_heap_sort(A, d=4):
+    """Sorts an array in place using heap sort on a d-ary max-heap.
+
+    The algorithm is the same as :func:`heap_sort()`. A wider heap is shallower, so every
+    extraction moves the top element through fewer, although wider, levels. Children of a
+    node are adjacent in memory, which makes the sift more cache-friendly on large arrays.
+
+    D-ary heap sort is not a stable sorting algorithm.
+
+    Complexity:
+        :math:`O(n d \log_d n)`.
+
+    :param list A: Array to sort.
+    :param int d: (optional) Arity of the heap.
+
+    """
+    build_d_max_heap(A, d)
+    for i in range(len(A) - 1, 0, -1):
+        A[0], A[i] = A[i], A[0]
+        d_max_heapify(A, 0, d, i)
 
 
 def insertion_sort(A):
@@ -0,0 +1,348 @@
+"""
+Caches
+======
+
+A cache keeps the results of expensive computations or lookups so that they can be reused.
+An unbounded cache, such as the dictionary of a memoization decorator, grows for as long as
+new keys keep coming. A bounded cache has to choose which entry to discard, or **evict**,
+once it is full. The rule that picks the victim is called the **eviction policy**.
+
+**Least recently used** (LRU) policy evicts the entry that has not been accessed for the
+longest time. Entries are kept in a doubly linked **recency list**: an accessed entry is
+moved to the head of the list, so the least recently used entry is always at the tail. A
+hash table maps keys to the nodes of the list, and both lookup and eviction take
+:math:`O(1)` time.
+
+**Least frequently used** (LFU) policy evicts the entry with the smallest number of
+accesses, which protects popular entries from a burst of one-time keys. To keep every
+operation in :math:`O(1)` time, entries with the same access count are kept in a recency
+list of their own, a **bucket**. Buckets form a doubly linked **frequency list** in the
+order of their counts, and a bucket is unlinked as soon as it becomes empty. An accessed
+entry moves from its bucket to the head of the next one, which is created if the next
+bucket in the list has a higher count. The victim is the tail of the first bucket, which
+breaks ties between equally frequent entries in LRU order.
+
+Both caches may be bounded by the number of entries, by the total size of the values in
+bytes, or by both. A callback can be notified of every evicted entry, and the caches count
+their hits and misses, so that the size of a cache can be tuned by its **hit ratio**.
+"""
+import sys
+from abc import ABC, abstractmethod
+
+from basic.linked_list import Node, LinkedList, list_insert, list_delete
+
+
+class Entry(Node):
+    """Node of a recency list holding a cached value.
+    """
+    value = None
+    size = 0  # Size of the value in bytes
+    bucket = None  # Bucket of entries with the same number of accesses, LFU only
+
+    def __init__(self, key, value, size):
+        """Node of a recency list holding a cached value.
+
+        :param object key: Key of an entry.
+        :param object value: Cached value.
+        :param int size: Size of the value in bytes.
+
+        """
+        super().__init__(key)
+        self.value = value
+        self.size = size
+
+
+class RecencyList(LinkedList):
+    """Doubly linked list with a pointer to its tail, most recently used node first.
+    """
+    tail = None
+
+
+class Bucket(Node):
+    """Node of a frequency list, keyed by an access count.
+
+    Holds a recency list of the entries that were accessed that many times.
+    """
+    entries = None
+
+    def __init__(self, count):
+        """Node of a frequency list, keyed by an access count.
+
+        :param int count: Number of accesses of the entries in the bucket.
+
+        """
+        super().__init__(count)
+        self.entries = RecencyList()
+
+
+def push_front(L, x):
+    """Inserts a node at the head of a recency list.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param RecencyList L: Recency list.
+    :param Entry x: Node to insert.
+
+    """
+    list_insert(L, x)
+    if x.next is None:
+        L.tail = x
+
+
+def remove(L, x):
+    """Removes a node from a recency list.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param RecencyList L: Recency list.
+    :param Entry x: Node to remove.
+
+    """
+    if L.tail is x:
+        L.tail = x.prev
+    list_delete(L, x)
+    x.prev = x.next = None
+
+
+class Cache(ABC):
+    """Common bookkeeping of bounded caches.
+
+    Subclasses decide which entry to evict by implementing the abstract hooks.
+    """
+    map = {}  # Key to entry
+    maxsize = None  # Maximum number of entries
+    maxbytes = None  # Maximum total size of values
+    sizeof = None
+    on_evict = None
+    nbytes = 0  # Total size of values
+    hits = 0
+    misses = 0
+    evictions = 0
+
+    def __init__(self, maxsize=128, maxbytes=None, sizeof=sys.getsizeof, on_evict=None):
+        """Common bookkeeping of bounded caches.
+
+        :param int maxsize: (optional) Maximum number of entries, unlimited if
+         :data:`None`.
+        :param int maxbytes: (optional) Maximum total size of values in bytes, unlimited if
+         :data:`None`.
+        :param (object)->int sizeof: (optional) Function that measures the size of a value.
+        :param (object, object)->None on_evict: (optional) Called with the key and the value
+         of every evicted entry.
+
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("Cache size must be positive")
+        self.map = {}
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.on_evict = on_evict
+
+    def __len__(self):
+        return len(self.map)
+
+    def __contains__(self, k):
+        return k in self.map
+
+    def get(self, k, default=None):
+        """Looks up a value and marks its entry as accessed.
+
+        Complexity:
+            :math:`O(1)` expected.
+
+        :param object k: Key.
+        :param object default: (optional) Value returned if the key is not cached.
+        :return: Cached value or the default.
+
+        """
+        x = self.map.get(k)
+        if x is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.touch(x)
+        return x.value
+
+    def put(self, k, v):
+        """Caches a value, evicting entries as needed to stay within the bounds.
+
+        The value of a cached key is replaced in place and the entry is marked as accessed,
+        so it keeps its position in the eviction order. A value larger than the byte bound
+        is not cached at all.
+
+        Complexity:
+            :math:`O(1)` expected, per evicted entry.
+
+        :param object k: Key.
+        :param object v: Value.
+
+        """
+        s = self.sizeof(v) if self.maxbytes is not None else 0
+        x = self.map.get(k)
+        if self.maxbytes is not None and s > self.maxbytes:
+            if x is not None:
+                self.delete(k)
+            return
+        if x is not None:
+            self.nbytes += s - x.size
+            x.value = v
+            x.size = s
+            self.touch(x)
+            self.evict(0, 0)  # The value may have grown
+            return
+        self.evict(1, s)
+        x = Entry(k, v, s)
+        self.map[k] = x
+        self.nbytes += s
+        self.add(x)
+
+    def evict(self, n, s):
+        """Evicts entries until a number of new entries and bytes fits within the bounds.
+
+        Complexity:
+            :math:`O(1)` expected, per evicted entry.
+
+        :param int n: Number of entries to make room for.
+        :param int s: Number of bytes to make room for.
+
+        """
+        while len(self.map) > 0 and (
+                (self.maxsize is not None and len(self.map) + n > self.maxsize) or
+                (self.maxbytes is not None and self.nbytes + s > self.maxbytes)):
+            x = self.victim()
+            self.delete(x.key)
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(x.key, x.value)
+
+    def delete(self, k):
+        """Removes an entry without counting it as an eviction.
+
+        Complexity:
+            :math:`O(1)` expected.
+
+        :param object k: Key of a cached entry.
+        :return: Removed value.
+
+        """
+        x = self.map.pop(k)
+        self.nbytes -= x.size
+        self.discard(x)
+        return x.value
+
+    def stats(self):
+        """Returns counters of a cache.
+
+        :return: Dictionary of hits, misses, evictions, the hit ratio and the current
+         number of entries and bytes.
+
+        """
+        n = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "hit_ratio": self.hits / n if n > 0 else 0.0,
+                "size": len(self.map), "bytes": self.nbytes}
+
+    @abstractmethod
+    def add(self, x):
+        """Starts tracking a new entry.
+        """
+
+    @abstractmethod
+    def touch(self, x):
+        """Marks an entry as accessed.
+        """
+
+    @abstractmethod
+    def discard(self, x):
+        """Stops tracking an entry.
+        """
+
+    @abstractmethod
+    def victim(self):
+        """Returns the entry to evict.
+        """
+
+
+class LRUCache(Cache):
+    """Bounded cache that evicts the least recently used entry.
+    """
+    L = None  # Recency list
+
+    def __init__(self, maxsize=128, maxbytes=None, sizeof=sys.getsizeof, on_evict=None):
+        """Bounded cache that evicts the least recently used entry.
+
+        Parameters are described in :class:`Cache`.
+
+        """
+        super().__init__(maxsize, maxbytes, sizeof, on_evict)
+        self.L = RecencyList()
+
+    def __iter__(self):
+        """Iterates over the keys from the most to the least recently used.
+        """
+        return (x.key for x in self.L)
+
+    def add(self, x):
+        push_front(self.L, x)
+
+    def touch(self, x):
+        if self.L.head is not x:
+            remove(self.L, x)
+            push_front(self.L, x)
+
+    def discard(self, x):
+        remove(self.L, x)
+
+    def victim(self):
+        return self.L.tail
+
+
+class LFUCache(Cache):
+    """Bounded cache that evicts the least frequently used entry, and the least recently
+    used one among equally frequent entries.
+    """
+    F = None  # Frequency list of buckets in increasing order of their counts
+
+    def __init__(self, maxsize=128, maxbytes=None, sizeof=sys.getsizeof, on_evict=None):
+        """Bounded cache that evicts the least frequently used entry.
+
+        Parameters are described in :class:`Cache`.
+
+        """
+        super().__init__(maxsize, maxbytes, sizeof, on_evict)
+        self.F = LinkedList()
+
+    def add(self, x):
+        b = self.F.head
+        if b is None or b.key != 1:
+            b = Bucket(1)
+            list_insert(self.F, b)
+        x.bucket = b
+        push_front(b.entries, x)
+
+    def touch(self, x):
+        b = x.bucket
+        c = b.next
+        if c is None or c.key != b.key + 1:  # Link a new bucket right after `b`
+            c = Bucket(b.key + 1)
+            c.prev = b
+            c.next = b.next
+            if b.next is not None:
+                b.next.prev = c
+            b.next = c
+        self.discard(x)
+        x.bucket = c
+        push_front(c.entries, x)
+
+    def discard(self, x):
+        b = x.bucket
+        remove(b.entries, x)
+        x.bucket = None
+        if b.entries.head is None:
+            list_delete(self.F, b)
+
+    def victim(self):
+        return self.F.head.entries.tail
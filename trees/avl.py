@@ -13,9 +13,9 @@ factor** help to maintain its representation invariant.
 dynamic set, such as insertion and deletion of a node. Balanced tree structure guarantees
 :math:`O(\log n)` time for node lookups, insertions and deletions.
 """
-from trees.bst import BST, Node as BSTNode
+from trees.bst import BST, Node as BSTNode, CompactNode as CompactBSTNode
 from trees.bst import right_rotate, left_rotate
-from trees.bst import tree_insert, tree_delete
+from trees.bst import tree_insert, tree_delete, tree_minimum
 
 
 class AVLTree(BST):
@@ -40,6 +40,21 @@ class Node(BSTNode):
         super().__init__(key)
 
 
+class CompactNode(CompactBSTNode):
+    """Compact variant of :class:`Node` with attributes stored in slots.
+    """
+    __slots__ = ("height",)
+
+    def __init__(self, key):
+        """Compact variant of :class:`Node` with attributes stored in slots.
+
+        :param object key: Node's key.
+
+        """
+        super().__init__(key)
+        self.height = 0
+
+
 def height(x):
     """Returns height attribute of a node.
 
@@ -115,7 +130,7 @@ def avl_rebalance(T, x):
         f = balance_factor(x)
         if f < -1:  # `x`'s right subtree is "heavier"
             a = x.right
-            if height(a.left) >= height(a.right):  # Right successors form a "zig-zag"
+            if height(a.left) > height(a.right):  # Right successors form a "zig-zag"
                 right_rotate(T, a)
                 update_height(a)
                 left_rotate(T, x)
@@ -124,7 +139,7 @@ def avl_rebalance(T, x):
             update_height(x)
         elif f > 1:  # `x`'s left subtree is "heavier"
             b = x.left
-            if height(b.right) >= height(b.left):  # Left successors form a "zig-zag"
+            if height(b.right) > height(b.left):  # Left successors form a "zig-zag"
                 left_rotate(T, b)
                 update_height(b)
                 right_rotate(T, x)
@@ -164,6 +179,10 @@ def avl_delete(T, z):
     :param trees.avl.Node z: Node to remove.
 
     """
-    p = z.p
+    if z.left is not None and z.right is not None:
+        y = tree_minimum(z.right)  # Successor takes the place of `z`
+        p = y if y.p is z else y.p  # Lowest node whose subtree lost a node
+    else:
+        p = z.p  # first node that is potentially out of balance is the parent.
     tree_delete(T, z)
-    avl_rebalance(T, p)  # first node that is potentially out of balance is the parent.
+    avl_rebalance(T, p)
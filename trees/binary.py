@@ -17,6 +17,12 @@ and right subtree. This operation recurs until all the nodes in a sub-tree are e
 
 The operations that don't change the dynamic set of a tree are called **querying**.
 Operations that cause change are called **updating**.
+
+Every node class has a **compact** variant that declares its attributes in ``__slots__``.
+A compact node has no per-instance attribute dictionary, which makes it about a third
+smaller, but no attributes other than the declared ones can be attached to it. Tree
+algorithms only access the declared attributes, so both kinds of nodes can be used
+interchangeably.
 """
 
 
@@ -47,6 +53,25 @@ class Node:
         return str(self.key)
 
 
+class CompactNode:
+    """Node of a binary tree with attributes stored in slots.
+    """
+    __slots__ = ("key", "left", "right")
+
+    def __init__(self, key):
+        """Node of a binary tree with attributes stored in slots.
+
+        :param object key: Node's key.
+
+        """
+        self.key = key
+        self.left = None
+        self.right = None
+
+    def __str__(self):
+        return str(self.key)
+
+
 def pre_order(x, f):
     """Pre-order tree traversal.
 
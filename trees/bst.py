@@ -19,20 +19,43 @@ Most BST operations take :math:`O(h)` time where *h* is a height of a tree. If a
 perfectly complete and **balanced**, *h* will be *log(n)*. In worst case, with all the
 nodes on one side, BST will resemble a linked list and take *O(n)* as its height will be
 proportional to the number of elements.
+
+Every node is augmented with the **size** of its subtree, the number of nodes in it. The
+size of a node only depends on its children, so it is recomputed bottom-up on the path of
+an insertion or a deletion and for the two nodes of a rotation. With sizes known, the
+**rank** of a node, its position in the sorted order, and the node of a given rank, the
+*i*-th **order statistic**, are found in :math:`O(h)` time, without a traversal. Trees
+with other attributes of this kind extend :meth:`BST.update`.
 """
 from trees.binary import BinaryTree, Node as BinaryTreeNode
+from trees.binary import CompactNode as CompactBinaryTreeNode
 
 
 class BST(BinaryTree):
     """Similar to a regular BinaryTree, holds a pointer to the root node.
     """
-    pass
+
+    def update(self, x):
+        """Recomputes the augmented attributes of a node from its children.
+
+        Called by every update operation, bottom-up, for each node whose subtree has
+        changed. Subclasses that augment nodes with more attributes extend this method.
+
+        Complexity:
+            :math:`O(1)`.
+
+        :param trees.bst.Node x: Node with up to date children.
+
+        """
+        x.size = size(x.left) + size(x.right) + 1
 
 
 class Node(BinaryTreeNode):
-    """An augmented variant of a BinaryTreeNode with a pointer to its parent.
+    """An augmented variant of a BinaryTreeNode with a pointer to its parent and the size
+    of its subtree.
     """
     p = None
+    size = 1
 
     def __init__(self, key):
         """An augmented variant of a BinaryTreeNode with a pointer to its parent.
@@ -43,6 +66,53 @@ class Node(BinaryTreeNode):
         super().__init__(key)
 
 
+class CompactNode(CompactBinaryTreeNode):
+    """Compact variant of :class:`Node` with attributes stored in slots.
+    """
+    __slots__ = ("p", "size")
+
+    def __init__(self, key):
+        """Compact variant of :class:`Node` with attributes stored in slots.
+
+        :param object key: Node's key.
+
+        """
+        super().__init__(key)
+        self.p = None
+        self.size = 1
+
+
+def size(x):
+    """Returns the size of a subtree, null nodes have a size of :math:`0`.
+
+    Complexity:
+        :math:`O(1)`.
+
+    :param trees.bst.Node x: Root of a subtree.
+    :return int: Number of nodes in a subtree.
+
+    """
+    if x is None:
+        return 0
+    else:
+        return x.size
+
+
+def update_path(T, x):
+    """Updates the augmented attributes of a node and all of its ancestors.
+
+    Complexity:
+        :math:`O(h)` where :math:`h` is the height of a tree.
+
+    :param BST T: Instance of a BST.
+    :param trees.bst.Node x: Lowest node whose subtree has changed, or :data:`None`.
+
+    """
+    while x is not None:
+        T.update(x)
+        x = x.p
+
+
 def tree_search(x, k):
     """Recursive search query algorithm for finding a key in BST.
 
@@ -198,6 +268,8 @@ def tree_insert(T, z):
         y.left = z
     elif z.key > y.key:
         y.right = z
+    T.update(z)
+    update_path(T, y)  # Subtrees on the path to `z` have grown
 
 
 def transplant(T, u, v):
@@ -240,18 +312,23 @@ def tree_delete(T, z):
 
     """
     if z.left is None:  # `z` has only right child
+        p = z.p  # Lowest node whose subtree has shrunk
         transplant(T, z, z.right)
     elif z.right is None:  # `z` has only left child
+        p = z.p
         transplant(T, z, z.left)
     else:  # `z` has both left and right child
         y = tree_minimum(z.right)  # `z`'s successor
+        p = y
         if y.p is not z:  # Successor is not `z`'s right child
+            p = y.p
             transplant(T, y, y.right)
             y.right = z.right
             y.right.p = y
         transplant(T, z, y)  # Successor is `z`'s right child
         y.left = z.left
         y.left.p = y
+    update_path(T, p)
 
 
 def left_rotate(T, x):
@@ -288,6 +365,8 @@ def left_rotate(T, x):
         x.p.right = y
     y.left = x
     x.p = y
+    T.update(x)  # `x` is now a child of `y`
+    T.update(y)
 
 
 def right_rotate(T, x):
@@ -308,6 +387,8 @@ def right_rotate(T, x):
         x.p.left = y
     y.right = x
     x.p = y
+    T.update(x)
+    T.update(y)
 
 
 def successor_order(x, f):
@@ -331,3 +412,74 @@ def successor_order(x, f):
     while y is not None:
         f(y)
         y = tree_successor(y)
+
+
+def tree_rank(T, x):
+    """Returns the rank of a node, its position in an in-order traversal of a tree.
+
+    Nodes in the left subtree of :math:`x` precede it. Going up the tree, every time
+    :math:`x`'s subtree is a right child, its parent and the parent's left subtree precede
+    it as well.
+
+    Complexity:
+        :math:`O(h)` where :math:`h` is the height of a tree.
+
+    :param BST T: Instance of a BST.
+    :param trees.bst.Node x: Node of the tree.
+    :return int: Rank of a node, starting with :math:`1` for the minimum.
+
+    """
+    r = size(x.left) + 1
+    y = x
+    while y is not T.root:
+        if y is y.p.right:
+            r += size(y.p.left) + 1
+        y = y.p
+    return r
+
+
+def tree_select(x, i):
+    """Finds a node with a given rank, the :math:`i`-th smallest key in a subtree.
+
+    Complexity:
+        :math:`O(h)` where :math:`h` is the height of a tree.
+
+    :param trees.bst.Node x: Root node.
+    :param int i: Rank, starting with :math:`1` for the minimum.
+    :return: Node with the rank :math:`i` in the subtree of :math:`x`.
+
+    """
+    if not 1 <= i <= size(x):
+        raise IndexError("Rank out of range")
+    while True:
+        r = size(x.left) + 1
+        if i == r:
+            return x
+        elif i < r:
+            x = x.left
+        else:
+            i -= r
+            x = x.right
+
+
+def tree_count_less(x, k):
+    """Counts the keys smaller than a given key in a subtree.
+
+    The key does not have to be present in the tree.
+
+    Complexity:
+        :math:`O(h)` where :math:`h` is the height of a tree.
+
+    :param trees.bst.Node x: Root node.
+    :param object k: A key.
+    :return int: Number of keys smaller than :math:`k`.
+
+    """
+    c = 0
+    while x is not None:
+        if x.key < k:
+            c += size(x.left) + 1
+            x = x.right
+        else:
+            x = x.left
+    return c
@@ -0,0 +1,202 @@
+"""
+Interval Trees
+==============
+
+Interval tree is a red-black tree that holds a dynamic set of closed intervals
+:math:`[low, high]`. Every node holds an interval and is keyed by its low endpoint, so an
+in-order traversal lists intervals sorted by their start. Two intervals **overlap** if
+each of them starts before the other one ends.
+
+In addition, every node is augmented with the **max**, the largest high endpoint in its
+subtree. It depends only on the node and its children, so it is maintained through the
+:meth:`IntervalTree.update` hook of the tree, along with the size of a subtree, at no
+extra asymptotic cost for insertions, deletions and rotations.
+
+The max attribute lets a search skip subtrees. If the max of the left subtree is smaller
+than the start of a query, no interval there can overlap it. If the query ends before the
+low endpoint of a node, nothing to the right of the node can overlap it either. One
+overlapping interval is found in :math:`O(\\log n)` time. A **stabbing query** finds the
+intervals that contain a given point, a query of the interval :math:`[t, t]`.
+"""
+from trees.red_black import RedBlackTree, Node as RBNode, CompactNode as CompactRBNode
+from trees.red_black import rb_insert, rb_delete
+
+
+class IntervalTree(RedBlackTree):
+    """Red-Black tree of intervals, augmented with the maximum endpoint of every subtree.
+    """
+
+    def update(self, x):
+        """Recomputes the size and the max of a node from its children.
+
+        :param trees.interval.Node x: Node with up to date children.
+
+        """
+        super().update(x)
+        m = x.high
+        if x.left is not None and x.left.max > m:
+            m = x.left.max
+        if x.right is not None and x.right.max > m:
+            m = x.right.max
+        x.max = m
+
+
+class Node(RBNode):
+    """A red-black tree node holding an interval, keyed by its low endpoint.
+    """
+    high = None
+    max = None  # Largest high endpoint in the subtree
+
+    def __init__(self, low, high):
+        """A red-black tree node holding an interval, keyed by its low endpoint.
+
+        :param object low: Start of an interval.
+        :param object high: End of an interval.
+
+        """
+        if high < low:
+            raise ValueError("Interval ends before it starts")
+        super().__init__(low)
+        self.high = high
+        self.max = high
+
+    def __str__(self):
+        return "[%s, %s]" % (self.key, self.high)
+
+
+class CompactNode(CompactRBNode):
+    """Compact variant of :class:`Node` with attributes stored in slots.
+    """
+    __slots__ = ("high", "max")
+
+    def __init__(self, low, high):
+        """Compact variant of :class:`Node` with attributes stored in slots.
+
+        :param object low: Start of an interval.
+        :param object high: End of an interval.
+
+        """
+        if high < low:
+            raise ValueError("Interval ends before it starts")
+        super().__init__(low)
+        self.high = high
+        self.max = high
+
+    __str__ = Node.__str__
+
+
+def interval_insert(T, z):
+    """Inserts an interval into an interval tree.
+
+    Intervals with equal low endpoints are allowed.
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param IntervalTree T: Instance of an interval tree.
+    :param trees.interval.Node z: Node holding a new interval.
+
+    """
+    rb_insert(T, z)
+
+
+def interval_delete(T, z):
+    """Removes an interval from an interval tree.
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param IntervalTree T: Instance of an interval tree.
+    :param trees.interval.Node z: Node to remove.
+
+    """
+    rb_delete(T, z)
+
+
+def overlaps(x, low, high):
+    """Evaluates if the interval of a node overlaps a closed interval.
+
+    :param trees.interval.Node x: Subject node.
+    :param object low: Start of an interval.
+    :param object high: End of an interval.
+    :return: :data:`True` if the intervals have at least one point in common.
+
+    """
+    return x.key <= high and low <= x.high
+
+
+def interval_search(T, low, high):
+    """Finds any interval that overlaps a given interval.
+
+    If the left subtree may hold an overlapping interval, its max reaches the query, and
+    the search goes left. If it does not find one there, then no interval in the right
+    subtree overlaps either, since they all start after the intervals on the left.
+
+    Complexity:
+        :math:`O(\\log n)`.
+
+    :param IntervalTree T: Instance of an interval tree.
+    :param object low: Start of a query interval.
+    :param object high: End of a query interval.
+    :return: Node with an overlapping interval or :data:`None`.
+
+    """
+    x = T.root
+    while x is not None and not overlaps(x, low, high):
+        if x.left is not None and x.left.max >= low:
+            x = x.left
+        else:
+            x = x.right
+    return x
+
+
+def interval_search_all(T, low, high):
+    """Finds all intervals that overlap a given interval, in the order of their low
+    endpoints.
+
+    Subtrees whose max is smaller than the start of the query are skipped, as are the
+    right subtrees of nodes that start after the end of the query.
+
+    Complexity:
+        :math:`O(\\min(n, k \\log n))`, where :math:`k` is the number of reported
+        intervals.
+
+    :param IntervalTree T: Instance of an interval tree.
+    :param object low: Start of a query interval.
+    :param object high: End of a query interval.
+    :return: List of nodes with overlapping intervals.
+
+    """
+    out = []
+    S = []  # Stack of nodes whose left subtree is being visited
+    x = T.root
+    while len(S) > 0 or x is not None:
+        if x is not None and x.max >= low:
+            S.append(x)
+            x = x.left
+        else:
+            if len(S) == 0:
+                break
+            x = S.pop()
+            if x.key > high:  # Nothing from here on starts before the query ends
+                break
+            if low <= x.high:
+                out.append(x)
+            x = x.right
+    return out
+
+
+def interval_stab(T, t):
+    """Finds all intervals that contain a given point.
+
+    Complexity:
+        :math:`O(\\min(n, k \\log n))`, where :math:`k` is the number of reported
+        intervals.
+
+    :param IntervalTree T: Instance of an interval tree.
+    :param object t: A point.
+    :return: List of nodes with intervals containing :math:`t`, in the order of their low
+     endpoints.
+
+    """
+    return interval_search_all(T, t, t)
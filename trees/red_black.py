@@ -13,9 +13,11 @@ A red-black tree is a binary tree that satisfies the following red black propert
     5. For each node, all simple paths from the node to descendant leaves contain the same number of black nodes.
 
 The number of black nodes on any simple path from, but not including, a node :math:`x` down to a leaf is called the **black-height** of the node, denoted :math:`bh(x)`.
+
+Deletion of a black node removes a black node from some paths, which violates property 5. The node that moves into its place is then treated as if it had an "extra black", which is pushed up the tree by recoloring or absorbed by at most three rotations. Leaves are null pointers rather than a shared sentinel node, so the parent of the node carrying the extra black is tracked explicitly.
 """
-from trees.bst import BST, Node as BSTNode
-from trees.bst import left_rotate, right_rotate
+from trees.bst import BST, Node as BSTNode, CompactNode as CompactBSTNode
+from trees.bst import left_rotate, right_rotate, transplant, tree_minimum, update_path
 
 
 class RedBlackTree(BST):
@@ -38,6 +40,21 @@ class Node(BSTNode):
         super().__init__(key)
 
 
+class CompactNode(CompactBSTNode):
+    """Compact variant of :class:`Node` with attributes stored in slots.
+    """
+    __slots__ = ("color",)
+
+    def __init__(self, key):
+        """Compact variant of :class:`Node` with attributes stored in slots.
+
+        :param object key: Node's key.
+
+        """
+        super().__init__(key)
+        self.color = None
+
+
 def rb_insert(T, z):
     """
 
@@ -64,33 +81,172 @@ def rb_insert(T, z):
     z.left = None
     z.right = None
     z.color = RED
+    T.update(z)
+    update_path(T, y)
     rb_insert_fixup(T, z)
 
 
 def rb_insert_fixup(T, z):
-    """
+    """Restores red-black properties after an insertion of a red node.
 
-    :param RedBlackTree T:
-    :param trees.red_black.Node z:
+    Only property 4 can be violated, by :math:`z` and its red parent. The violation is
+    either moved two levels up the tree by recoloring, or fixed by at most two rotations.
+
+    Complexity:
+        :math:`O(\log n)`.
+
+    :param RedBlackTree T: Instance of Red-Black Tree to update.
+    :param trees.red_black.Node z: Inserted node.
 
     """
-    while z.p.color == RED:
-        if z.p == z.p.p.left:
-            y = z.p.p.right
-            if y.color == RED:
+    while z.p is not None and z.p.color == RED:  # Red parent is never the root
+        if z.p is z.p.p.left:
+            y = z.p.p.right  # Uncle of `z`
+            if y is not None and y.color == RED:
                 z.p.color = BLACK
                 y.color = BLACK
                 z.p.p.color = RED
                 z = z.p.p
-            elif z == z.p.right:
-                z = z.p
-                left_rotate(T, z)
-            z.p.color = BLACK
-            z.p.p.color = RED
-            right_rotate(T, z.p.p)
+            else:
+                if z is z.p.right:
+                    z = z.p
+                    left_rotate(T, z)
+                z.p.color = BLACK
+                z.p.p.color = RED
+                right_rotate(T, z.p.p)
+        else:  # Symmetric, with "left" and "right" exchanged
+            y = z.p.p.left
+            if y is not None and y.color == RED:
+                z.p.color = BLACK
+                y.color = BLACK
+                z.p.p.color = RED
+                z = z.p.p
+            else:
+                if z is z.p.left:
+                    z = z.p
+                    right_rotate(T, z)
+                z.p.color = BLACK
+                z.p.p.color = RED
+                left_rotate(T, z.p.p)
+    T.root.color = BLACK
 
 
-# TODO
+def color(x):
+    """Returns the color of a node, null leaves are black.
+
+    :param trees.red_black.Node x: Subject node or :data:`None`.
+    :return: Color of a node.
+
+    """
+    return BLACK if x is None else x.color
+
+
+def rb_delete(T, z):
+    """Removes a node from a Red-Black Tree.
+
+    Node :math:`y` is either :math:`z` itself, if it has at most one child, or its
+    successor that takes its place and its color. Node :math:`x` moves into :math:`y`'s
+    original position. If :math:`y` was black, the black-height of the paths through
+    :math:`x` is one short and the red-black properties are restored by
+    :func:`rb_delete_fixup()`.
+
+    Complexity:
+        :math:`O(\log n)`.
+
+    :param RedBlackTree T: Instance of Red-Black Tree to update.
+    :param trees.red_black.Node z: Node to remove.
+
+    """
+    y = z
+    y_color = y.color
+    if z.left is None:
+        x, p = z.right, z.p  # `p` tracks the parent of `x`, which may be a null leaf
+        transplant(T, z, z.right)
+    elif z.right is None:
+        x, p = z.left, z.p
+        transplant(T, z, z.left)
+    else:
+        y = tree_minimum(z.right)  # `z`'s successor
+        y_color = y.color
+        x = y.right
+        if y.p is z:
+            p = y
+        else:
+            p = y.p
+            transplant(T, y, y.right)
+            y.right = z.right
+            y.right.p = y
+        transplant(T, z, y)
+        y.left = z.left
+        y.left.p = y
+        y.color = z.color
+    update_path(T, p)  # `p` is the lowest node whose subtree has shrunk
+    if y_color == BLACK:
+        rb_delete_fixup(T, x, p)
+
+
+def rb_delete_fixup(T, x, p):
+    """Restores red-black properties after a removal of a black node.
+
+    Node :math:`x` carries an extra black. The loop moves it up the tree while the sibling
+    :math:`w` of :math:`x` is black with black children, or absorbs it by rotations
+    otherwise. A red :math:`x` is simply colored black.
+
+    Complexity:
+        :math:`O(\log n)`, with at most three rotations.
+
+    :param RedBlackTree T: Instance of Red-Black Tree to update.
+    :param trees.red_black.Node x: Node that took the place of the removed node, or
+     :data:`None`.
+    :param trees.red_black.Node p: Parent of :math:`x`.
+
+    """
+    while x is not T.root and color(x) == BLACK:
+        if x is p.left:
+            w = p.right  # Sibling of `x`, never a null leaf
+            if w.color == RED:  # Case 1, make the sibling black
+                w.color = BLACK
+                p.color = RED
+                left_rotate(T, p)
+                w = p.right
+            if color(w.left) == BLACK and color(w.right) == BLACK:  # Case 2, move up
+                w.color = RED
+                x, p = p, p.p
+            else:
+                if color(w.right) == BLACK:  # Case 3, make the far nephew red
+                    w.left.color = BLACK
+                    w.color = RED
+                    right_rotate(T, w)
+                    w = p.right
+                w.color = p.color  # Case 4, absorb the extra black
+                p.color = BLACK
+                w.right.color = BLACK
+                left_rotate(T, p)
+                x = T.root
+        else:  # Symmetric, with "left" and "right" exchanged
+            w = p.left
+            if w.color == RED:
+                w.color = BLACK
+                p.color = RED
+                right_rotate(T, p)
+                w = p.left
+            if color(w.right) == BLACK and color(w.left) == BLACK:
+                w.color = RED
+                x, p = p, p.p
+            else:
+                if color(w.left) == BLACK:
+                    w.right.color = BLACK
+                    w.color = RED
+                    left_rotate(T, w)
+                    w = p.left
+                w.color = p.color
+                p.color = BLACK
+                w.left.color = BLACK
+                right_rotate(T, p)
+                x = T.root
+    if x is not None:
+        x.color = BLACK
+
 
 BLACK = "black"
 RED = "red"